@@ -14,7 +14,6 @@ from typing import (
     type_check_only,
 )
 
-from .cssselect import LxmlTranslator
 from .etree import HTMLParser, QName, XMLParser, _Element, _ElementTree
 
 if sys.version_info >= (3, 14):
@@ -201,5 +200,18 @@ _FileReadSource = (
 )  # fmt: skip
 _FileWriteSource = _FilePath | Writer[bytes]
 
+@type_check_only
+class _CSSTranslator(Protocol):
+    """Translator object accepted by cssselect related API
+
+    Only `css_to_xpath()` is used by lxml, which
+    `lxml.cssselect.LxmlTranslator` and translators from
+    `cssselect` package all provide. Using a protocol instead
+    of the concrete class avoids loading `lxml.cssselect` and
+    `cssselect` annotations for every `lxml.etree` user.
+    """
+
+    def css_to_xpath(self, css: str, prefix: str = ...) -> str: ...
+
 # Shared across cssselect methods from multiple places
-_CSSTransArg = LxmlTranslator | Literal["xml", "html", "xhtml"]
+_CSSTransArg = _CSSTranslator | Literal["xml", "html", "xhtml"]
@@ -52,6 +52,7 @@ from ._module_func import (
     fromstringlist as fromstringlist,
     indent as indent,
     iselement as iselement,
+    memory_debugger as memory_debugger,
     parse as parse,
     register_namespace as register_namespace,
     tostring as tostring,
@@ -87,7 +88,9 @@ from ._nsclasses import (
     NamespaceRegistryError as NamespaceRegistryError,
 )
 from ._parser import (
+    AsyncReader as AsyncReader,
     ETCompatXMLParser as ETCompatXMLParser,
+    EventPullParser as EventPullParser,
     HTMLParser as HTMLParser,
     HTMLPullParser as HTMLPullParser,
     ParseError as ParseError,
@@ -106,11 +109,15 @@ from ._relaxng import (
     RelaxNGValidateError as RelaxNGValidateError,
 )
 from ._saxparser import (
+    DataTarget as DataTarget,
+    NamespaceTarget as NamespaceTarget,
     ParserTarget as ParserTarget,
+    StartEndTarget as StartEndTarget,
     TreeBuilder as TreeBuilder,
     XMLSyntaxAssertionError as XMLSyntaxAssertionError,
 )
 from ._serializer import (
+    AsyncWriter as AsyncWriter,
     C14NWriterTarget as C14NWriterTarget,
     SerialisationError as SerialisationError,
     canonicalize as canonicalize,
@@ -53,6 +53,8 @@ class iterparse(Iterator[_T_co]):
     - [API documentation](https://lxml.de/apidoc/lxml.etree.html#lxml.etree.iterparse)
     """
 
+    # Keyword arguments are deliberately repeated instead of using
+    # Unpack[TypedDict]; see comment above etree.XMLParser
     @overload  # html mode -> namespace events suppressed
     def __new__(  # type: ignore[overload-overlap]  # pyright: ignore[reportOverlappingOverload]
         cls,
@@ -304,6 +304,8 @@ def fromstring(
     [API Documentation](https://lxml.de/apidoc/lxml.etree.html#lxml.etree.fromstring)
     """
 
+# Items are fed to parser one by one, therefore unlike fromstring(),
+# buffer objects other than bytes are rejected
 @overload
 @deprecated("Raises exception if input is a single string")
 def fromstringlist(
@@ -1,5 +1,6 @@
 import sys
 from collections.abc import (
+    Awaitable,
     Iterable,
     Iterator,
 )
@@ -7,10 +8,11 @@ from typing import (
     Any,
     Generic,
     Literal,
-    TypeVar,
+    Protocol,
     overload,
     type_check_only,
 )
+from typing_extensions import TypeVar
 
 from .._types import (
     _DefEtreeParsers,
@@ -23,7 +25,7 @@ from ._classlookup import ElementClassLookup
 from ._docloader import _ResolverRegistry
 from ._element import _Element
 from ._module_misc import LxmlError, LxmlSyntaxError
-from ._saxparser import ParserTarget
+from ._saxparser import _AnyTarget
 from ._xmlerror import _ListErrorLog
 from ._xmlschema import XMLSchema
 
@@ -38,6 +40,17 @@ else:
     from typing_extensions import deprecated
 
 _T = TypeVar("_T")
+_T_co = TypeVar("_T_co", covariant=True)
+
+# Event tuples emitted by pull parsers, equivalent to those of
+# iterparse(). Default is the catch-all combination of all events.
+_PullEvent_co = TypeVar(
+    "_PullEvent_co",
+    covariant=True,
+    default=tuple[Literal["start", "end", "comment", "pi"], _Element]
+    | tuple[Literal["start-ns"], tuple[str, str]]
+    | tuple[Literal["end-ns"], None],
+)
 
 class ParseError(LxmlSyntaxError):
     code: int
@@ -58,11 +71,46 @@ class XMLSyntaxError(ParseError): ...
 class ParserError(LxmlError): ...
 
 @type_check_only
-class _PullParserMixin:
-    # The iterated items from pull parser events may return anything.
-    # Even etree.TreeBuilder, which produce element nodes by default, allows
-    # overriding factory functions via arguments to generate anything.
-    def read_events(self) -> Iterator[tuple[str, _Element | Any]]: ...
+class _PullParserMixin(Generic[_T_co]):
+    # Pull parsers don't accept custom 'target' in stub, so the event
+    # tuples are fully determined by 'events' argument
+    def read_events(self) -> Iterator[_T_co]: ...
+
+@type_check_only
+class AsyncReader(Protocol[_T_co]):
+    """This is a stub-only class representing asynchronous data source
+    for feed parsers.
+
+    Annotation
+    ----------
+    lxml has no asyncio support of its own. Data from asynchronous
+    sources, such as `asyncio.StreamReader`, is awaited chunk by chunk
+    and passed to `feed()` of a parser. This is the asynchronous
+    counterpart of `io.Reader`, where `read()` returns an awaitable.
+
+    See Also
+    --------
+    - [`asyncio.StreamReader.read()`](https://docs.python.org/3/library/asyncio-stream.html#asyncio.StreamReader.read)
+    """
+
+    def read(self, size: int = ..., /) -> Awaitable[_T_co]: ...
+
+@type_check_only
+class EventPullParser(Protocol[_T_co]):
+    """This is a stub-only class representing interface shared by
+    `XMLPullParser` and `HTMLPullParser`.
+
+    Annotation
+    ----------
+    The subscript is the event tuple produced by `read_events()`,
+    which pull parsers determine from their `events` argument. Use it
+    to annotate code driving any pull parser, like an asynchronous
+    loop feeding data from `AsyncReader`.
+    """
+
+    def feed(self, data: str | bytes, /) -> None: ...
+    def read_events(self) -> Iterator[_T_co]: ...
+    def close(self) -> object: ...
 
 # TODO Write wiki page and add link to this docstring
 @type_check_only
@@ -89,6 +137,7 @@ class CustomTargetParser(Generic[_T]):
         --------
         - [API Documentation](https://lxml.de/apidoc/lxml.etree.html#lxml.etree.XMLParser.feed_error_log)
         """
+    # Unlike fromstring(), other buffer objects are rejected
     def feed(self, data: str | bytes) -> None:
         """Feeds data to the parser. The argument should be an 8-bit string
         buffer containing encoded data, although Unicode is supported as long
@@ -99,7 +148,7 @@ class CustomTargetParser(Generic[_T]):
         - [API Documentation](https://lxml.de/apidoc/lxml.etree.html#lxml.etree.XMLParser.feed)
         """
     @property
-    def target(self) -> ParserTarget[_T]: ...
+    def target(self) -> _AnyTarget[_T]: ...
     def close(self) -> _T:
         """Terminates feeding data to this parser. This tells the parser to
         process any remaining data in the feed buffer, and then returns the root
@@ -122,6 +171,11 @@ class CustomTargetParser(Generic[_T]):
 # and every subclass to override the behavior. mypy is unaffected
 # (due to non-support of __new__ here)
 #
+# 3. Keyword arguments are spelt out in every overload on purpose.
+# Collapsing them into Unpack[TypedDict] brings no measurable gain for
+# any checker, while making pyrefly noticeably slower (see
+# 'parser_options' slice of tests/perf benchmark).
+#
 class XMLParser(Generic[_ET_co]):
     """The XML Parser. Parsers can be supplied as additional argument
     to various parse functions of the lxml API.
@@ -170,7 +224,7 @@ class XMLParser(Generic[_ET_co]):
         remove_pis: bool = False,
         strip_cdata: bool = True,
         collect_ids: bool = True,
-        target: ParserTarget[_T],
+        target: _AnyTarget[_T],
         compact: bool = True,
     ) -> CustomTargetParser[_T]:
         """The XML Parser. Parsers can be supplied as additional argument
@@ -229,6 +283,7 @@ class XMLParser(Generic[_ET_co]):
         --------
         - [API Documentation](https://lxml.de/apidoc/lxml.etree.html#lxml.etree.XMLParser.feed_error_log)
         """
+    # Unlike fromstring(), other buffer objects are rejected
     def feed(self, data: str | bytes) -> None:
         """Feeds data to the parser. The argument should be an 8-bit string
         buffer containing encoded data, although Unicode is supported as long
@@ -250,24 +305,124 @@ class XMLParser(Generic[_ET_co]):
         - [API Documentation](https://lxml.de/apidoc/lxml.etree.html#lxml.etree.XMLParser.close)
         """
 
-class XMLPullParser(_PullParserMixin, XMLParser[_ET_co]):
+class XMLPullParser(
+    _PullParserMixin[_PullEvent_co],
+    XMLParser[_ET_co],
+    Generic[_ET_co, _PullEvent_co],
+):
     """XML parser that collects parse events in an iterator.
 
+    Annotation
+    ----------
+    Like `iterparse()`, the type of event tuples produced by
+    `read_events()` is determined by `events` argument, which
+    is stored as second subscript of the parser:
+    - `start`, `end`, `comment` and `pi` events, where only
+      Element values are produced
+    - `start-ns` or `end-ns` events, producing
+      namespace tuple (for `start-ns`) or nothing (`end-ns`)
+    - Catch-all signature for other events combination
+    - `events` arg absent, implying only `end` event is emitted
+
     See Also
     --------
     - [API Documentation](https://lxml.de/apidoc/lxml.etree.html#lxml.etree.XMLPullParser)
     """
     # HACK: Suppress superclass .__new__(), otherwise pyright thinks
     # this class always generate etree.XMLParser instances (#100)
+    #
+    # All arguments from XMLParser, except 'target' which is
+    # removed. Leave custom target parser creation to XMLParser
+    # and HTMLParser.
+    @overload  # element-only events
+    def __new__(
+        cls,
+        events: Iterable[Literal["start", "end", "comment", "pi"]],
+        *,
+        tag: _TagSelector | Iterable[_TagSelector] | None = None,
+        base_url: str | bytes | None = None,
+        encoding: _TextArg | None = None,
+        attribute_defaults: bool = False,
+        dtd_validation: bool = False,
+        load_dtd: bool = False,
+        no_network: bool = True,
+        ns_clean: bool = False,
+        recover: bool = False,
+        schema: XMLSchema | None = None,
+        huge_tree: bool = False,
+        remove_blank_text: bool = False,
+        resolve_entities: bool | Literal["internal"] = "internal",
+        remove_comments: bool = False,
+        remove_pis: bool = False,
+        strip_cdata: bool = True,
+        collect_ids: bool = True,
+        compact: bool = True,
+    ) -> XMLPullParser[
+        _ET_co, tuple[Literal["start", "end", "comment", "pi"], _ET_co]
+    ]: ...
+    @overload  # NS-only events
+    def __new__(
+        cls,
+        events: Iterable[Literal["start-ns", "end-ns"]],
+        *,
+        tag: _TagSelector | Iterable[_TagSelector] | None = None,
+        base_url: str | bytes | None = None,
+        encoding: _TextArg | None = None,
+        attribute_defaults: bool = False,
+        dtd_validation: bool = False,
+        load_dtd: bool = False,
+        no_network: bool = True,
+        ns_clean: bool = False,
+        recover: bool = False,
+        schema: XMLSchema | None = None,
+        huge_tree: bool = False,
+        remove_blank_text: bool = False,
+        resolve_entities: bool | Literal["internal"] = "internal",
+        remove_comments: bool = False,
+        remove_pis: bool = False,
+        strip_cdata: bool = True,
+        collect_ids: bool = True,
+        compact: bool = True,
+    ) -> XMLPullParser[
+        _ET_co,
+        tuple[Literal["start-ns"], tuple[str, str]] | tuple[Literal["end-ns"], None],
+    ]: ...
+    @overload  # other mixed events
+    def __new__(
+        cls,
+        events: Iterable[_SaxEventNames],
+        *,
+        tag: _TagSelector | Iterable[_TagSelector] | None = None,
+        base_url: str | bytes | None = None,
+        encoding: _TextArg | None = None,
+        attribute_defaults: bool = False,
+        dtd_validation: bool = False,
+        load_dtd: bool = False,
+        no_network: bool = True,
+        ns_clean: bool = False,
+        recover: bool = False,
+        schema: XMLSchema | None = None,
+        huge_tree: bool = False,
+        remove_blank_text: bool = False,
+        resolve_entities: bool | Literal["internal"] = "internal",
+        remove_comments: bool = False,
+        remove_pis: bool = False,
+        strip_cdata: bool = True,
+        collect_ids: bool = True,
+        compact: bool = True,
+    ) -> XMLPullParser[
+        _ET_co,
+        tuple[Literal["start", "end", "comment", "pi"], _ET_co]
+        | tuple[Literal["start-ns"], tuple[str, str]]
+        | tuple[Literal["end-ns"], None],
+    ]: ...
+    @overload  # events absent -> only 'end' event emitted
     def __new__(
         cls,
-        events: Iterable[_SaxEventNames] | None = None,
+        events: None = None,
         *,
         tag: _TagSelector | Iterable[_TagSelector] | None = None,
         base_url: str | bytes | None = None,
-        # All arguments from XMLParser, except 'target' which is
-        # removed. Leave custom target parser creation to XMLParser
-        # and HTMLParser.
         encoding: _TextArg | None = None,
         attribute_defaults: bool = False,
         dtd_validation: bool = False,
@@ -284,7 +439,7 @@ class XMLPullParser(_PullParserMixin, XMLParser[_ET_co]):
         strip_cdata: bool = True,
         collect_ids: bool = True,
         compact: bool = True,
-    ) -> XMLPullParser[_ET_co]: ...
+    ) -> XMLPullParser[_ET_co, tuple[Literal["end"], _ET_co]]: ...
 
 # This is XMLParser with some preset keyword arguments, and without
 # 'collect_ids' argument. Removing those keywords here, otherwise
@@ -351,7 +506,7 @@ class HTMLParser(Generic[_ET_co]):
         remove_comments: bool = False,
         remove_pis: bool = False,
         no_network: bool = True,
-        target: ParserTarget[_T],
+        target: _AnyTarget[_T],
         schema: XMLSchema | None = None,
         recover: bool = True,
         compact: bool = True,
@@ -437,6 +592,7 @@ class HTMLParser(Generic[_ET_co]):
         --------
         - [API Documentation](https://lxml.de/apidoc/lxml.etree.html#lxml.etree.HTMLParser.feed_error_log)
         """
+    # Unlike fromstring(), other buffer objects are rejected
     def feed(self, data: str | bytes) -> None:
         """Feeds data to the parser. The argument should be an 8-bit string
         buffer containing encoded data, although Unicode is supported as long
@@ -458,25 +614,57 @@ class HTMLParser(Generic[_ET_co]):
         - [API Documentation](https://lxml.de/apidoc/lxml.etree.html#lxml.etree.HTMLParser.close)
         """
 
-class HTMLPullParser(_PullParserMixin, HTMLParser[_ET_co]):
+class HTMLPullParser(
+    _PullParserMixin[_PullEvent_co],
+    HTMLParser[_ET_co],
+    Generic[_ET_co, _PullEvent_co],
+):
     """HTML parser that collects parse events in an iterator.
 
+    Annotation
+    ----------
+    Namespace events are never emitted in HTML mode, so `read_events()`
+    only produces Element values, like `iterparse(html=True)`. The
+    event names are stored as second subscript of the parser.
+
     See Also
     --------
     - [API Documentation](https://lxml.de/apidoc/lxml.etree.html#lxml.etree.HTMLPullParser)
     """
     # HACK: Suppress superclass .__new__(), otherwise pyright thinks
     # this class always generate etree.HTMLParser instances (#100)
-    @overload
+    #
+    # All arguments from HTMLParser, except 'target' which is
+    # removed. Leave custom target parser creation to XMLParser
+    # and HTMLParser.
+    @overload  # events specified, namespace events suppressed
+    def __new__(
+        cls,
+        events: Iterable[_SaxEventNames],
+        *,
+        tag: _TagSelector | Iterable[_TagSelector] | None = None,
+        base_url: str | bytes | None = None,
+        encoding: _TextArg | None = None,
+        remove_blank_text: bool = False,
+        remove_comments: bool = False,
+        remove_pis: bool = False,
+        no_network: bool = True,
+        schema: XMLSchema | None = None,
+        recover: bool = True,
+        compact: bool = True,
+        default_doctype: bool = True,
+        collect_ids: bool = True,
+        huge_tree: bool = False,
+    ) -> HTMLPullParser[
+        _ET_co, tuple[Literal["start", "end", "comment", "pi"], _ET_co]
+    ]: ...
+    @overload  # events absent -> only 'end' event emitted
     def __new__(
         cls,
-        events: Iterable[_SaxEventNames] | None = None,
+        events: None = None,
         *,
         tag: _TagSelector | Iterable[_TagSelector] | None = None,
         base_url: str | bytes | None = None,
-        # All arguments from XMLParser, except 'target' which is
-        # removed. Leave custom target parser creation to XMLParser
-        # and HTMLParser.
         encoding: _TextArg | None = None,
         remove_blank_text: bool = False,
         remove_comments: bool = False,
@@ -488,7 +676,7 @@ class HTMLPullParser(_PullParserMixin, HTMLParser[_ET_co]):
         default_doctype: bool = True,
         collect_ids: bool = True,
         huge_tree: bool = False,
-    ) -> HTMLPullParser[_ET_co]: ...
+    ) -> HTMLPullParser[_ET_co, tuple[Literal["end"], _ET_co]]: ...
     @overload
     @deprecated("strip_cdata argument was always useless, and dropped after 5.2.2")
     def __new__(
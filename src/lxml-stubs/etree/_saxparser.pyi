@@ -13,20 +13,20 @@ class XMLSyntaxAssertionError(XMLSyntaxError, AssertionError):
     def __init__(self, message: object) -> None: ...
 
 @type_check_only
-class ParserTarget(Protocol[_T_co]):
-    """This is a stub-only class representing parser target interface.
+class StartEndTarget(Protocol[_T_co]):
+    """This is a stub-only class representing parser target which only
+    handles element start and end events.
 
     Annotation
     ----------
-    All custom target objects should inherit from this class if they
-    want to be fully annotated. Please [check out wiki
-    page](https://github.com/abelcheung/types-lxml/wiki/Custom-target-parser)
-    on how to do this and how to use the custom target parser.
+    Lxml only invokes callbacks that a target object actually defines,
+    so targets which merely count or aggregate elements don't need to
+    implement the rest of `ParserTarget` interface. Combine with
+    `DataTarget` or `NamespaceTarget` for targets handling more events.
 
     See Also
     --------
     - [Target parser official document](https://lxml.de/parsing.html#the-target-parser-interface)
-    - [`_PythonSaxParserTarget()`](https://github.com/lxml/lxml/blob/820db896be83f72f1cb653981362c682c8fc0d1f/src/lxml/parsertarget.pxi#L20)
     """
 
     @abstractmethod
@@ -34,9 +34,6 @@ class ParserTarget(Protocol[_T_co]):
     # All parameters marked positional, to stop pyright from
     # complaining about incompatible parameter names. They are
     # never called with keyword arguments anyway.
-    def comment(self, text: str, /) -> None: ...
-    def data(self, data: str, /) -> None: ...
-    def end(self, tag: str, /) -> None: ...
     # TODO Think about how to handle 3-argument form later,
     # presumably for SaxParserTarget.
     def start(
@@ -45,12 +42,70 @@ class ParserTarget(Protocol[_T_co]):
         attrib: dict[str, str],
         /,
     ) -> None: ...
+    def end(self, tag: str, /) -> None: ...
+
+@type_check_only
+class DataTarget(Protocol[_T_co]):
+    """This is a stub-only class representing parser target which only
+    handles text content.
+
+    Annotation
+    ----------
+    See `StartEndTarget` for more info.
+    """
+
+    @abstractmethod
+    def close(self) -> _T_co: ...
+    def data(self, data: str, /) -> None: ...
+
+@type_check_only
+class NamespaceTarget(Protocol[_T_co]):
+    """This is a stub-only class representing parser target which only
+    handles namespace declaration events.
+
+    Annotation
+    ----------
+    Namespace events are never emitted in HTML mode. See `StartEndTarget`
+    for more info.
+    """
+
+    @abstractmethod
+    def close(self) -> _T_co: ...
     # Methods below are undocumented. Lxml has described
     # 'start-ns' and 'end-ns' events however.
-    def pi(self, target: str, data: str, /) -> None: ...
     # Default namespace prefix is empty string, not None
     def start_ns(self, prefix: str, uri: str, /) -> None: ...
     def end_ns(self, prefix: str, /) -> None: ...
+
+@type_check_only
+class ParserTarget(
+    StartEndTarget[_T_co],
+    DataTarget[_T_co],
+    NamespaceTarget[_T_co],
+    Protocol[_T_co],
+):
+    """This is a stub-only class representing parser target interface.
+
+    Annotation
+    ----------
+    All custom target objects should inherit from this class if they
+    want to be fully annotated. Please [check out wiki
+    page](https://github.com/abelcheung/types-lxml/wiki/Custom-target-parser)
+    on how to do this and how to use the custom target parser. Targets
+    handling only part of parser events can use `StartEndTarget`,
+    `DataTarget` or `NamespaceTarget` instead, or any combination of them.
+
+    See Also
+    --------
+    - [Target parser official document](https://lxml.de/parsing.html#the-target-parser-interface)
+    - [`_PythonSaxParserTarget()`](https://github.com/lxml/lxml/blob/820db896be83f72f1cb653981362c682c8fc0d1f/src/lxml/parsertarget.pxi#L20)
+    """
+
+    @abstractmethod
+    def close(self) -> _T_co: ...
+    def comment(self, text: str, /) -> None: ...
+    # Methods below are undocumented.
+    def pi(self, target: str, data: str, /) -> None: ...
     def doctype(
         self,
         root_tag: str | None,
@@ -59,6 +114,9 @@ class ParserTarget(Protocol[_T_co]):
         /,
     ) -> None: ...
 
+# Any target object handling at least one group of parser events
+_AnyTarget = StartEndTarget[_T_co] | DataTarget[_T_co] | NamespaceTarget[_T_co]
+
 @disjoint_base
 class TreeBuilder(ParserTarget[_Element]):
     """Build an ElementTree from SAX events.
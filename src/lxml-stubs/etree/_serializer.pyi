@@ -1,5 +1,6 @@
 import sys
 from collections.abc import (
+    Awaitable,
     Callable,
     Iterable,
 )
@@ -10,8 +11,11 @@ from contextlib import (
 from types import TracebackType
 from typing import (
     Any,
+    Protocol,
+    TypeVar,
     final,
     overload,
+    type_check_only,
 )
 from typing_extensions import disjoint_base
 
@@ -45,6 +49,8 @@ if sys.version_info >= (3, 14):
 else:
     from typing_extensions import Writer
 
+_T_contra = TypeVar("_T_contra", contravariant=True)
+
 class SerialisationError(LxmlError): ...
 
 # Usage identical to custom target parser, but canonicalized output
@@ -356,6 +362,30 @@ class _AsyncIncrementalFileWriter:
         **_extra: _AttrVal,
     ) -> AbstractAsyncContextManager[None]: ...
 
+@type_check_only
+class AsyncWriter(Protocol[_T_contra]):
+    """This is a stub-only class representing asynchronous output sink
+    of `xmlfile` and `htmlfile`.
+
+    Annotation
+    ----------
+    This is the asynchronous counterpart of `io.Writer`, where `write()`
+    returns an awaitable. Serialised data is written to it as `bytes`
+    when using `async with xmlfile(...)`. If `close=True` is passed to
+    `xmlfile`, the sink is expected to have a `close()` method as well,
+    which may also be a coroutine function.
+
+    `asyncio.StreamWriter.write()` is not awaitable, so wrap it with an
+    object whose `write()` calls `StreamWriter.write()` and then awaits
+    `StreamWriter.drain()`.
+
+    See Also
+    --------
+    - [Asynchronous incremental serialisation](https://lxml.de/api.html#incremental-xml-generation)
+    """
+
+    def write(self, data: _T_contra, /) -> Awaitable[object]: ...
+
 @disjoint_base
 class xmlfile(
     AbstractAsyncContextManager[_AsyncIncrementalFileWriter],
@@ -363,13 +393,19 @@ class xmlfile(
 ):
     """A simple mechanism for incremental XML serialisation.
 
+    Annotation
+    ----------
+    Output file can be an `AsyncWriter` for use in `async with` statement.
+    Using such asynchronous sink in plain `with` statement is not caught
+    by type checkers; lxml would silently drop all unawaited writes.
+
     See Also
     --------
     - [API Documentation](https://lxml.de/apidoc/lxml.etree.html#lxml.etree.xmlfile)
     """
     def __init__(
         self,
-        output_file: _FileWriteSource,
+        output_file: _FileWriteSource | AsyncWriter[bytes],
         encoding: _TextArg | None = None,
         compression: int | None = None,
         close: bool = False,
@@ -0,0 +1,58 @@
+"""Extraction of element names selected by literal CSS selectors."""
+
+from __future__ import annotations
+
+import re
+
+from ._xpath import top_level
+
+_COMBINATORS = " \t\r\n\f>+~"
+
+# Type selector at the start of a compound selector, possibly with
+# namespace prefix
+_TYPE_SELECTOR_RE = re.compile(r"(?:([\w-]*|\*)\|)?([^\W\d][\w-]*|\*)?")
+
+
+def _subject_name(selector: str) -> str | None:
+    """Type selector name of the last compound selector"""
+    selector = selector.strip()
+    chars = top_level(selector)
+    if not selector or chars is None:
+        return None
+    start = 0
+    for i, ch in chars:
+        if ch in _COMBINATORS:
+            start = i + 1
+    subject = selector[start:]
+    if not subject:
+        return None
+    m = _TYPE_SELECTOR_RE.match(subject)
+    assert m is not None
+    prefix, name = m.groups()
+    if prefix is not None or not name:
+        return "*"
+    return name.lower()
+
+
+def css_element_names(css: str) -> frozenset[str] | None:
+    """Return lower cased element names selected by a CSS selector
+    group, or None if the selector can't be analysed
+
+    Selectors whose subject has no type selector, has a wildcard or
+    a namespace prefix contribute "*" to the result.
+    """
+    if "\\" in css:  # escapes
+        return None
+    chars = top_level(css)
+    if chars is None:
+        return None
+    names: set[str] = set()
+    start = 0
+    for i, ch in [*chars, (len(css), ",")]:
+        if ch == ",":
+            name = _subject_name(css[start:i])
+            if name is None:
+                return None
+            names.add(name)
+            start = i + 1
+    return frozenset(names)
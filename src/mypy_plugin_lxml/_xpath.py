@@ -0,0 +1,220 @@
+"""Conservative classification of literal XPath 1.0 expressions.
+
+Only expressions whose result type is obvious from their shape are
+classified; anything else (operators, literals, variables, extension
+functions, mixed node types) yields None, and the plugin falls back
+to annotation in stubs.
+"""
+
+from __future__ import annotations
+
+import enum
+import re
+
+
+class XPathKind(enum.Enum):
+    ELEMENTS = "elements"  # node-set of elements only
+    STRINGS = "strings"  # node-set of text or attribute nodes
+    NUMBER = "number"
+    BOOLEAN = "boolean"
+    STRING = "string"
+
+
+_FUNC_KINDS = {
+    **dict.fromkeys(
+        (
+            "count",
+            "sum",
+            "number",
+            "string-length",
+            "floor",
+            "ceiling",
+            "round",
+            "last",
+            "position",
+        ),
+        XPathKind.NUMBER,
+    ),
+    **dict.fromkeys(
+        ("boolean", "not", "true", "false", "contains", "starts-with", "lang"),
+        XPathKind.BOOLEAN,
+    ),
+    **dict.fromkeys(
+        (
+            "string",
+            "concat",
+            "substring",
+            "substring-before",
+            "substring-after",
+            "normalize-space",
+            "translate",
+            "name",
+            "local-name",
+            "namespace-uri",
+        ),
+        XPathKind.STRING,
+    ),
+}
+
+_NAME = r"[^\W\d][\w.\-]*"
+_NAME_TEST = rf"(?:\*|{_NAME}(?::(?:\*|{_NAME}))?)"
+_AXES = (
+    "child",
+    "descendant",
+    "descendant-or-self",
+    "ancestor",
+    "ancestor-or-self",
+    "following",
+    "following-sibling",
+    "preceding",
+    "preceding-sibling",
+    "parent",
+    "self",
+)
+
+_AXIS = "|".join(_AXES)
+
+_ELEMENT_STEP_RE = re.compile(rf"(?:(?:{_AXIS})\s*::\s*)?{_NAME_TEST}")
+_STRING_STEP_RE = re.compile(
+    rf"(?:@\s*|attribute\s*::\s*){_NAME_TEST}|(?:child\s*::\s*)?text\s*\(\s*\)"
+)
+_PLAIN_NAME_STEP_RE = re.compile(rf"(?:(?:{_AXIS})\s*::\s*)?({_NAME})")
+# Steps allowed before the last one, which don't affect result type
+_INNER_STEP_RE = re.compile(rf"\.\.?|(?:(?:{_AXIS})\s*::\s*)?node\s*\(\s*\)")
+_FUNC_CALL_RE = re.compile(rf"({_NAME})\s*\(")
+
+
+def top_level(expr: str) -> list[tuple[int, str]] | None:
+    """Characters outside of quotes, brackets and parentheses,
+    including the outermost brackets themselves, along with their
+    position; None if brackets are unbalanced"""
+    result: list[tuple[int, str]] = []
+    depth = 0
+    quote = ""
+    for i, ch in enumerate(expr):
+        if quote:
+            if ch == quote:
+                quote = ""
+            continue
+        if ch in "\"'":
+            quote = ch
+            if depth:
+                continue
+        elif ch in "[(":
+            depth += 1
+            if depth > 1:
+                continue
+        elif ch in "])":
+            depth -= 1
+            if depth < 0:
+                return None
+            if depth > 0:
+                continue
+        elif depth:
+            continue
+        result.append((i, ch))
+    if depth or quote:
+        return None
+    return result
+
+
+def _split(expr: str, sep: str) -> list[str] | None:
+    chars = top_level(expr)
+    if chars is None:
+        return None
+    parts: list[str] = []
+    start = 0
+    for i, ch in chars:
+        if ch == sep:
+            parts.append(expr[start:i])
+            start = i + 1
+    parts.append(expr[start:])
+    return parts
+
+
+def _strip_predicates(step: str) -> str | None:
+    """Remove trailing predicates from a location step"""
+    chars = top_level(step)
+    if chars is None:
+        return None
+    for n, (i, ch) in enumerate(chars):
+        if ch == "[":
+            # Nothing but predicates may follow
+            if any(c not in "[] \t\r\n" for _, c in chars[n:]):
+                return None
+            return step[:i].strip()
+    return step.strip()
+
+
+def _classify_path(path: str) -> XPathKind | None:
+    steps = _split(path, "/")
+    if steps is None:
+        return None
+    stripped = [_strip_predicates(s) for s in steps]
+    *inner, last = stripped
+    for step in inner:
+        if step is None:
+            return None
+        # Empty steps come from leading "/" and "//"
+        if step and not (
+            _INNER_STEP_RE.fullmatch(step) or _ELEMENT_STEP_RE.fullmatch(step)
+        ):
+            return None
+    if not last:
+        return None
+    if _ELEMENT_STEP_RE.fullmatch(last):
+        return XPathKind.ELEMENTS
+    if _STRING_STEP_RE.fullmatch(last):
+        return XPathKind.STRINGS
+    return None
+
+
+def _classify_call(expr: str) -> XPathKind | None:
+    m = _FUNC_CALL_RE.match(expr)
+    if m is None or m.group(1) not in _FUNC_KINDS:
+        return None
+    # Whole expression must be the single function call
+    chars = top_level(expr)
+    if chars is None:
+        return None
+    open_pos = m.end() - 1
+    if [c for c in chars if c[0] >= open_pos] != [
+        (open_pos, "("),
+        (len(expr) - 1, ")"),
+    ]:
+        return None
+    return _FUNC_KINDS[m.group(1)]
+
+
+def classify_xpath(expr: str) -> XPathKind | None:
+    """Return kind of result produced by XPath expression,
+    or None if it can't be determined statically"""
+    expr = expr.strip()
+    if not expr:
+        return None
+    if (kind := _classify_call(expr)) is not None:
+        return kind
+    unions = _split(expr, "|")
+    if unions is None:
+        return None
+    kinds = {_classify_path(p) for p in unions}
+    if len(kinds) != 1:
+        return None
+    return kinds.pop()
+
+
+def element_names(expr: str) -> frozenset[str] | None:
+    """Return local names of elements selected by an XPath expression
+    classified as `XPathKind.ELEMENTS`, or None if any of them is a
+    wildcard or namespace prefixed name"""
+    unions = _split(expr.strip(), "|")
+    if unions is None:
+        return None
+    names: set[str] = set()
+    for path in unions:
+        steps = _split(path, "/")
+        last = None if steps is None else _strip_predicates(steps[-1])
+        if last is None or (m := _PLAIN_NAME_STEP_RE.fullmatch(last)) is None:
+            return None
+        names.add(m.group(1))
+    return frozenset(names)
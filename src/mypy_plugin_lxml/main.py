@@ -3,93 +3,654 @@ from __future__ import annotations
 from collections.abc import (
     Callable,
 )
-from typing import cast
+from functools import partial
+from typing import Optional, Tuple, cast
 
 from mypy.checker import (
     TypeChecker,
 )
+from mypy.maptype import map_instance_to_supertype
 from mypy.nodes import (
+    CallExpr,
+    MypyFile,
+    NameExpr,
+    RefExpr,
+    StrExpr,
     TypeInfo,
 )
+from mypy.options import Options
 from mypy.plugin import (
+    FunctionContext,
     MethodContext,
     Plugin,
 )
+from mypy.subtypes import find_member, is_subtype
+from mypy.type_visitor import TypeTranslator
+from mypy.typeops import make_simplified_union, try_getting_str_literals_from_type
 from mypy.types import (
+    CallableType,
     Instance,
+    LiteralType,
+    NoneType,
     Type,
+    TypeAliasType,
+    UnionType,
     get_proper_type,
 )
 
+from ._css import css_element_names
+from ._xpath import XPathKind, classify_xpath, element_names
+
+_FunctionHook = Callable[[FunctionContext], Type]
+_MethodHook = Callable[[MethodContext], Type]
+
+_SET_CLASS_LOOKUP_METHODS = ("set_element_class_lookup", "setElementClassLookup")
+
+# Parser classes bundled with lxml, whose subscripted element type
+# can be changed by set_element_class_lookup()
+_PARSER_CLASSES = (
+    "lxml.etree._parser.XMLParser",
+    "lxml.etree._parser.XMLPullParser",
+    "lxml.etree._parser.ETCompatXMLParser",
+    "lxml.etree._parser.HTMLParser",
+    "lxml.etree._parser.HTMLPullParser",
+    "lxml.html._parse.HTMLParser",
+    "lxml.html._parse.XHTMLParser",
+)
+
+_DEFAULT_ELEMENT = "lxml.etree._element._Element"
+_ELEMENT_TREE = "lxml.etree._element._ElementTree"
+
+# Generic parser base classes, whose subscript is the element class
+# produced by parsing functions
+_PARSER_BASES = ("lxml.etree._parser.XMLParser", "lxml.etree._parser.HTMLParser")
+
+# Parsing functions accepting `parser` argument, and whether
+# they return element tree instead of root element
+_PARSE_FUNCS = {
+    "lxml.etree._module_func.fromstring": False,
+    "lxml.etree._module_func.XML": False,
+    "lxml.etree._module_func.parse": True,
+}
+
+# Parser classes whose construction with custom `target` argument
+# produces CustomTargetParser. Mypy ignores __new__ return type that
+# is not subtype of the class, so the result is rebuilt here.
+_TARGET_PARSER_CLASSES = (
+    "lxml.etree._parser.XMLParser",
+    "lxml.etree._parser.HTMLParser",
+)
+_CUSTOM_TARGET_PARSER = "lxml.etree._parser.CustomTargetParser"
+
+# XPath evaluating classes, whether XPath expression is supplied
+# at construction time (instead of as argument of __call__), and
+# factory functions creating them
+_XPATH_EVALUATORS = (
+    ("lxml.etree._xpath.XPath", True, ()),
+    (
+        "lxml.etree._xpath.XPathElementEvaluator",
+        False,
+        ("lxml.etree._xpath.XPathEvaluator",),
+    ),
+)
+_SMART_STRING = "lxml.etree._xpath._ElementUnicodeResult"
+
+# Element iterating methods accepting tag selectors
+_ITER_METHODS = ("iter", "iterdescendants", "iterchildren", "itersiblings")
+# Special node factories which, as the only tag selector, limit
+# iterated nodes to those they create: (etree class, lxml.html class).
+# lxml checks factory identity, so they are matched by referenced name.
+_COMMENT_NODES = ("lxml.etree._element._Comment", "lxml.html._element.HtmlComment")
+_PI_NODES = (
+    "lxml.etree._element._ProcessingInstruction",
+    "lxml.html._element.HtmlProcessingInstruction",
+)
+_ENTITY_NODES = ("lxml.etree._element._Entity", "lxml.html._element.HtmlEntity")
+_SPECIAL_NODE_FACTORIES = {
+    "lxml.etree._factory_func.Comment": _COMMENT_NODES,
+    "lxml.etree._factory_func.ProcessingInstruction": _PI_NODES,
+    "lxml.etree._factory_func.PI": _PI_NODES,
+    "lxml.etree._factory_func.Entity": _ENTITY_NODES,
+}
+_CSS_SELECTOR = "lxml.cssselect.CSSSelector"
+
+# Element classes whose lookup picks different subclass per node,
+# so that XPath results are not necessarily of the same subclass as
+# the context element
+_HTML_ELEMENT = "lxml.html._element.HtmlElement"
+_ELEMENT_FAMILIES = (
+    _HTML_ELEMENT,
+    "lxml.objectify._element.ObjectifiedElement",
+)
+# html.HtmlElementClassLookup default mapping of lower cased tag name
+# to class
+_HTML_TAG_ELEMENTS = {
+    "form": "lxml.html._form.FormElement",
+    "textarea": "lxml.html._form.TextareaElement",
+    "select": "lxml.html._form.SelectElement",
+    "input": "lxml.html._form.InputElement",
+    "label": "lxml.html._form.LabelElement",
+}
+
+# Element class lookups and the element class they produce, in order
+# of matching. None means the element class is taken from subscript
+# of the lookup class.
+_LOOKUP_ELEMENTS: tuple[tuple[str, str | None], ...] = (
+    ("lxml.html._parse.HtmlElementClassLookup", _HTML_ELEMENT),
+    (
+        "lxml.objectify._misc.ObjectifyElementClassLookup",
+        "lxml.objectify._element.ObjectifiedElement",
+    ),
+    ("lxml.etree._classlookup.ElementDefaultClassLookup", None),
+)
+
+# Result of matching a lookup class against _LOOKUP_ELEMENTS:
+# (produced element class, matched base class or None if matched
+# the lookup class itself)
+_LookupMatch = Tuple[Optional[str], Optional[Instance]]
+
 
 class MypyLxmlPlugin(Plugin):
-    def get_method_hook(self, fullname: str) -> Callable[[MethodContext], Type] | None:
-        _, _, method_name = fullname.rpartition(".")
-        if method_name in {"set_element_class_lookup", "setElementClassLookup"}:
-            # Delegate class name checking to the hook, because we want to
-            # support user custom subclasses
-            return _set_class_lookup_method_hook
+    def __init__(self, options: Options) -> None:
+        super().__init__(options)
+        # get_method_hook() is consulted for every method call in the
+        # whole program. Keep the verdict of each fullname, so that
+        # anything beyond first lookup is a single dict access.
+        # Method name based fallback for subclasses, only applicable
+        # to classes derived from any of the listed lxml classes
+        self._hooks_by_method_name: dict[str, tuple[_MethodHook, tuple[str, ...]]] = {
+            **dict.fromkeys(
+                _SET_CLASS_LOOKUP_METHODS,
+                (self._set_class_lookup_method_hook, _PARSER_CLASSES),
+            ),
+            "xpath": (
+                partial(self._xpath_method_hook, call=False),
+                (_DEFAULT_ELEMENT, _ELEMENT_TREE),
+            ),
+            "__call__": (
+                partial(self._xpath_method_hook, call=True),
+                (*(cls for cls, _, _ in _XPATH_EVALUATORS), _CSS_SELECTOR),
+            ),
+            "cssselect": (self._cssselect_method_hook, (_DEFAULT_ELEMENT,)),
+            **dict.fromkeys(
+                _ITER_METHODS,
+                (self._iter_method_hook, (_DEFAULT_ELEMENT, _ELEMENT_TREE)),
+            ),
+        }
+        self._builtin_method_hooks: dict[str, _MethodHook | None] = {
+            "{}.{}".format(cls, meth): self._hooks_by_method_name[meth][0]
+            for cls, meths in (
+                *((cls, _SET_CLASS_LOOKUP_METHODS) for cls in _PARSER_CLASSES),
+                (_DEFAULT_ELEMENT, ("xpath", "cssselect", *_ITER_METHODS)),
+                (_HTML_ELEMENT, ("cssselect", *_ITER_METHODS)),
+                (_ELEMENT_TREE, ("xpath", "iter")),
+                *((cls, ("__call__",)) for cls, _, _ in _XPATH_EVALUATORS),
+                (_CSS_SELECTOR, ("__call__",)),
+            )
+            for meth in meths
+        }
+        self._method_hooks = dict(self._builtin_method_hooks)
+        self._function_hooks: dict[str, _FunctionHook] = {
+            **{
+                name: partial(self._parse_func_hook, tree=tree)
+                for name, tree in _PARSE_FUNCS.items()
+            },
+            **dict.fromkeys(_TARGET_PARSER_CLASSES, self._target_parser_hook),
+        }
+        # Caches used by hooks below, only valid for current build
+        self._typeinfos: dict[str, TypeInfo] = {}
+        self._lookup_matches: dict[str, _LookupMatch | None] = {}
+
+    def get_method_hook(self, fullname: str) -> _MethodHook | None:
+        try:
+            return self._method_hooks[fullname]
+        except KeyError:
+            pass
+        class_name, _, method_name = fullname.rpartition(".")
+        hook: _MethodHook | None = None
+        try:
+            hook, bases = self._hooks_by_method_name[method_name]
+        except KeyError:
+            pass
         else:
-            return None
+            sym = self.lookup_fully_qualified(class_name)
+            info = sym.node if sym is not None else None
+            if not (
+                isinstance(info, TypeInfo) and any(info.has_base(b) for b in bases)
+            ):
+                hook = None
+        self._method_hooks[fullname] = hook
+        return hook
 
+    def get_function_hook(self, fullname: str) -> _FunctionHook | None:
+        return self._function_hooks.get(fullname)
 
-def _set_class_lookup_method_hook(ctx: MethodContext) -> Type:
-    """Set subscript element type when changing class lookup for parsers"""
+    def set_modules(self, modules: dict[str, MypyFile]) -> None:
+        # Called at the start of every build, after which TypeInfos
+        # and class hierarchy from previous build may be stale
+        super().set_modules(modules)
+        self._method_hooks = dict(self._builtin_method_hooks)
+        self._typeinfos.clear()
+        self._lookup_matches.clear()
 
-    def _get_typeinfo_from(fullname: str) -> TypeInfo:
+    def _get_typeinfo(self, fullname: str) -> TypeInfo:
+        try:
+            return self._typeinfos[fullname]
+        except KeyError:
+            pass
         module_fullname, _, klass = fullname.rpartition(".")
-        assert isinstance(ctx.api, TypeChecker)
-        assert module_fullname in ctx.api.modules
-        mod = ctx.api.modules[module_fullname]
+        assert self._modules is not None
+        assert module_fullname in self._modules
+        mod = self._modules[module_fullname]
         assert klass in mod.names
         node = mod.names[klass].node
         assert isinstance(node, TypeInfo)
+        self._typeinfos[fullname] = node
         return node
 
-    def _create_instance_from(fullname: str) -> Instance:
-        return Instance(_get_typeinfo_from(fullname), [])
+    def _match_lookup(self, info: TypeInfo) -> _LookupMatch | None:
+        try:
+            return self._lookup_matches[info.fullname]
+        except KeyError:
+            pass
+        # Use stock class lookups -> check fullname
+        # Custom subclassed lookups -> check bases
+        result: _LookupMatch | None = None
+        for lookup_name, element in _LOOKUP_ELEMENTS:
+            if info.fullname == lookup_name:
+                result = (element, None)
+                break
+            base = next((b for b in info.bases if b.type.fullname == lookup_name), None)
+            if base is not None:
+                result = (element, base)
+                break
+        self._lookup_matches[info.fullname] = result
+        return result
+
+    def _set_class_lookup_method_hook(self, ctx: MethodContext) -> Type:
+        """Set subscript element type when changing class lookup for parsers"""
+
+        if len(ctx.arg_types) == 0:  # Non-generic class like html.HTMLParser
+            return ctx.default_return_type
+
+        assert len(ctx.arg_types) == 1
+        assert isinstance(ctx.type, Instance)
+        assert isinstance(ctx.api, TypeChecker)
+
+        if len(ctx.arg_types[0]) == 0:  # no arg = reset element lookup to default
+            _replace_element(
+                ctx.type, Instance(self._get_typeinfo(_DEFAULT_ELEMENT), [])
+            )
+            return ctx.default_return_type
 
-    def _fullname_or_base_is(name: str) -> Instance | None:
+        assert len(ctx.arg_types[0]) == 1
         lookup = get_proper_type(ctx.arg_types[0][0])
         assert isinstance(lookup, Instance)
-        # Use stock class lookups -> check fullname
-        # Custom subclassed lookups -> check bases
-        if lookup.type.fullname == name:
-            return lookup
 
-        for base in lookup.type.bases:
-            if base.type.fullname == name:
-                return base
+        match = self._match_lookup(lookup.type)
+        if match is None:
+            return ctx.default_return_type
+        element, base = match
+        if element is not None:
+            arg = Instance(self._get_typeinfo(element), [])
         else:
-            return None
+            arg = cast(Instance, (base or lookup).args[0])
+        _replace_element(ctx.type, arg)
 
-    if len(ctx.arg_types) == 0:  # Non-generic class like html.HTMLParser
         return ctx.default_return_type
 
-    assert len(ctx.arg_types) == 1
-    assert isinstance(ctx.type, Instance)
+    def _parser_element(self, parser: Instance) -> Type | None:
+        for base in parser.type.mro:
+            if base.fullname in _PARSER_BASES:
+                return map_instance_to_supertype(parser, base).args[0]
+        return None
 
-    if len(ctx.arg_types[0]) == 0:  # no arg = reset element lookup to default
-        ctx.type.args = (_create_instance_from("lxml.etree._element._Element"),)
-        return ctx.default_return_type
+    def _parse_func_hook(self, ctx: FunctionContext, tree: bool) -> Type:
+        """Infer parsing function result from the element class each
+        parser argument produces"""
 
-    assert len(ctx.arg_types[0]) == 1
-    arg = None
+        # Overloads already cover a single parser argument. This hook
+        # keeps union of parsers precise, where overload matching
+        # would join element classes into their common base.
+        try:
+            idx = ctx.callee_arg_names.index("parser")
+        except ValueError:
+            return ctx.default_return_type
+        if len(ctx.arg_types[idx]) != 1:
+            return ctx.default_return_type
+        parser = get_proper_type(ctx.arg_types[idx][0])
+        if not isinstance(parser, UnionType):
+            return ctx.default_return_type
 
-    if lookup := _fullname_or_base_is("lxml.html._parse.HtmlElementClassLookup"):
-        arg = _create_instance_from("lxml.html._element.HtmlElement")
-    elif lookup := _fullname_or_base_is(
-        "lxml.objectify._misc.ObjectifyElementClassLookup"
-    ):
-        arg = _create_instance_from("lxml.objectify._element.ObjectifiedElement")
-    elif lookup := _fullname_or_base_is(
-        "lxml.etree._classlookup.ElementDefaultClassLookup"
+        elements: list[Type] = []
+        for item in parser.items:
+            item = get_proper_type(item)
+            if isinstance(item, NoneType):
+                elements.append(Instance(self._get_typeinfo(_DEFAULT_ELEMENT), []))
+                continue
+            # Custom target parsers and anything unknown are left
+            # to overloads
+            elem = self._parser_element(item) if isinstance(item, Instance) else None
+            if elem is None:
+                return ctx.default_return_type
+            elements.append(elem)
+
+        if tree:
+            tree_info = self._get_typeinfo(_ELEMENT_TREE)
+            return make_simplified_union([Instance(tree_info, [e]) for e in elements])
+        return make_simplified_union(elements)
+
+    def _target_parser_hook(self, ctx: FunctionContext) -> Type:
+        """Infer custom target parser from return type of target's
+        close() method"""
+
+        try:
+            idx = ctx.callee_arg_names.index("target")
+        except ValueError:
+            return ctx.default_return_type
+        if len(ctx.arg_types[idx]) != 1:
+            return ctx.default_return_type
+        target = get_proper_type(ctx.arg_types[idx][0])
+        if not isinstance(target, Instance):
+            return ctx.default_return_type
+        close = get_proper_type(find_member("close", target, target))
+        if not isinstance(close, CallableType):
+            return ctx.default_return_type
+
+        return Instance(self._get_typeinfo(_CUSTOM_TARGET_PARSER), [close.ret_type])
+
+    def _xpath_method_hook(self, ctx: MethodContext, call: bool) -> Type:
+        """Infer XPath evaluation result from literal XPath expression"""
+
+        receiver = ctx.type
+        if not isinstance(receiver, Instance):
+            return ctx.default_return_type
+        info = receiver.type
+        assert isinstance(ctx.api, TypeChecker)
+
+        smart: bool | None = None
+        path_types: list[Type] = []
+        if not call:
+            # Name based fallback hands over xpath() of any class,
+            # which may have arbitrary signature if not from lxml
+            if info.has_base(_DEFAULT_ELEMENT):
+                element: Type = self._family_element(receiver)
+            elif info.has_base(_ELEMENT_TREE):
+                tree = self._get_typeinfo(_ELEMENT_TREE)
+                element = map_instance_to_supertype(receiver, tree).args[0]
+            else:
+                return ctx.default_return_type
+            if not ctx.arg_types:
+                return ctx.default_return_type
+            path_types = ctx.arg_types[0]
+            smart = self._bool_arg(ctx, "smart_strings", True)
+        elif info.has_base(_CSS_SELECTOR):
+            return self._css_selector_call(ctx)
+        else:
+            for evaluator, compiled, factories in _XPATH_EVALUATORS:
+                if info.has_base(evaluator):
+                    break
+            else:
+                return ctx.default_return_type
+            if not ctx.arg_types:
+                return ctx.default_return_type
+            # Constructor arguments are only visible when calling the
+            # constructor result directly, e.g. XPath("...")(root);
+            # smart_strings of stored evaluators is unknown
+            ctor = self._ctor_call(ctx, evaluator, factories)
+            if ctor is not None:
+                smart = _bool_expr(ctor, "smart_strings", True)
+            if not compiled:
+                # Element passed to evaluator constructor is not tracked
+                path_types = ctx.arg_types[0]
+                element = Instance(self._get_typeinfo(_DEFAULT_ELEMENT), [])
+            else:
+                path = _first_str_expr(ctor, (None,))
+                if path is None:
+                    return ctx.default_return_type
+                str_type = ctx.api.named_type("builtins.str")
+                path_types = [LiteralType(path, str_type)]
+                element = self._tree_element(ctx.arg_types[0])
+
+        if len(path_types) != 1:
+            return ctx.default_return_type
+        paths = try_getting_str_literals_from_type(path_types[0])
+        if paths is None or len(paths) != 1:
+            return ctx.default_return_type
+        kind = classify_xpath(paths[0])
+        if kind is None:
+            return ctx.default_return_type
+
+        if smart:
+            string = Instance(self._get_typeinfo(_SMART_STRING), [element])
+        else:
+            string = ctx.api.named_type("builtins.str")
+        if kind is XPathKind.ELEMENTS:
+            names = element_names(paths[0])
+            if names is not None:
+                element = self._html_tag_elements(element, names)
+            return self._list_result(ctx, element)
+        if kind is XPathKind.STRINGS:
+            return self._list_result(ctx, string)
+        if kind is XPathKind.NUMBER:
+            return ctx.api.named_type("builtins.float")
+        if kind is XPathKind.BOOLEAN:
+            return ctx.api.named_type("builtins.bool")
+        return string
+
+    def _cssselect_method_hook(self, ctx: MethodContext) -> Type:
+        """Narrow HTML elements selected by literal CSS selector"""
+
+        receiver = ctx.type
+        if not (
+            isinstance(receiver, Instance) and receiver.type.has_base(_HTML_ELEMENT)
+        ):
+            return ctx.default_return_type
+        if not ctx.arg_types or len(ctx.arg_types[0]) != 1:
+            return ctx.default_return_type
+        exprs = try_getting_str_literals_from_type(ctx.arg_types[0][0])
+        if exprs is None or len(exprs) != 1:
+            return ctx.default_return_type
+        return self._css_result(ctx, self._family_element(receiver), exprs[0])
+
+    def _iter_method_hook(self, ctx: MethodContext) -> Type:
+        """Narrow iterated nodes when the only tag selector is special
+        node factory, like `etree.Comment`"""
+
+        receiver = ctx.type
+        ret = get_proper_type(ctx.default_return_type)
+        if not (
+            isinstance(receiver, Instance)
+            and isinstance(ret, Instance)
+            and len(ret.args) == 1
+        ):
+            return ctx.default_return_type
+        tags = [
+            arg
+            for name, args in zip(ctx.callee_arg_names, ctx.args)
+            if name in ("tag", "tags")
+            for arg in args
+        ]
+        if not (len(tags) == 1 and isinstance(tags[0], RefExpr)):
+            return ctx.default_return_type
+        try:
+            etree_node, html_node = _SPECIAL_NODE_FACTORIES[tags[0].fullname]
+        except KeyError:
+            return ctx.default_return_type
+
+        element = get_proper_type(self._tree_element([receiver]))
+        if isinstance(element, Instance) and element.type.has_base(_HTML_ELEMENT):
+            node = html_node
+        else:
+            node = etree_node
+        return Instance(ret.type, [Instance(self._get_typeinfo(node), [])])
+
+    def _css_selector_call(self, ctx: MethodContext) -> Type:
+        # Like XPath, only selectors called right after construction
+        # are visible, e.g. CSSSelector("...")(root)
+        ctor = self._ctor_call(ctx, _CSS_SELECTOR)
+        css = _first_str_expr(ctor, (None, "css"))
+        if css is None or not ctx.arg_types:
+            return ctx.default_return_type
+        element = self._tree_element(ctx.arg_types[0])
+        return self._css_result(ctx, element, css)
+
+    @staticmethod
+    def _ctor_call(
+        ctx: MethodContext, cls: str, factories: tuple[str, ...] = ()
+    ) -> CallExpr | None:
+        """Expression constructing the called object, if it is constructed
+        right at the call site from class `cls` (or subclass) or one of
+        `factories`, e.g. `XPath("...")(root)`; objects returned by any
+        other call may be made from unrelated arguments"""
+        ctor = getattr(ctx.context, "callee", None)
+        if not (isinstance(ctor, CallExpr) and isinstance(ctor.callee, RefExpr)):
+            return None
+        node = ctor.callee.node
+        if isinstance(node, TypeInfo) and node.has_base(cls):
+            return ctor
+        if ctor.callee.fullname in factories:
+            return ctor
+        return None
+
+    def _css_result(self, ctx: MethodContext, element: Type, css: str) -> Type:
+        names = css_element_names(css)
+        proper = get_proper_type(element)
+        if not (
+            names is not None
+            and isinstance(proper, Instance)
+            and proper.type.fullname == _HTML_ELEMENT
+        ):
+            return ctx.default_return_type
+        element = self._html_tag_elements(element, names)
+        return self._list_result(ctx, element)
+
+    @staticmethod
+    def _list_result(ctx: MethodContext, item: Type) -> Type:
+        """List of inferred item type, or the list type expected by
+        context if its item type is a supertype, since list is invariant
+        and e.g. `list[HtmlElement]` annotation would reject
+        `list[InputElement]` otherwise"""
+        assert isinstance(ctx.api, TypeChecker)
+        type_context = ctx.api.expr_checker.type_context
+        if type_context and type_context[-1] is not None:
+            expected = get_proper_type(type_context[-1])
+            candidates = (
+                expected.items if isinstance(expected, UnionType) else [expected]
+            )
+            for cand in candidates:
+                cand = get_proper_type(cand)
+                if (
+                    isinstance(cand, Instance)
+                    and cand.type.fullname == "builtins.list"
+                    and is_subtype(item, cand.args[0])
+                ):
+                    return cand
+        return ctx.api.named_generic_type("builtins.list", [item])
+
+    def _html_tag_elements(self, element: Type, names: frozenset[str]) -> Type:
+        """Union of element classes HtmlElementClassLookup creates for
+        given tag names, or element itself if it isn't HtmlElement"""
+        proper = get_proper_type(element)
+        if not (isinstance(proper, Instance) and proper.type.fullname == _HTML_ELEMENT):
+            return element
+        return make_simplified_union([
+            Instance(self._get_typeinfo(_HTML_TAG_ELEMENTS[n.lower()]), [])
+            if n.lower() in _HTML_TAG_ELEMENTS
+            else element
+            for n in sorted(names)
+        ])
+
+    def _family_element(self, element: Instance) -> Instance:
+        """Base class of the element family the element belongs to,
+        or the element itself"""
+        for family in _ELEMENT_FAMILIES:
+            if element.type.has_base(family):
+                return Instance(self._get_typeinfo(family), [])
+        return element
+
+    def _tree_element(self, arg_types: list[Type]) -> Type:
+        """Element class contained in element or tree argument"""
+        if len(arg_types) == 1:
+            arg = get_proper_type(arg_types[0])
+            if isinstance(arg, Instance):
+                if arg.type.has_base(_DEFAULT_ELEMENT):
+                    return self._family_element(arg)
+                if arg.type.has_base(_ELEMENT_TREE):
+                    tree = self._get_typeinfo(_ELEMENT_TREE)
+                    return map_instance_to_supertype(arg, tree).args[0]
+        return Instance(self._get_typeinfo(_DEFAULT_ELEMENT), [])
+
+    @staticmethod
+    def _bool_arg(ctx: MethodContext, name: str, default: bool) -> bool | None:
+        """Value of literal bool argument, None if not a literal;
+        default if argument is not supplied or not accepted at all"""
+        try:
+            idx = ctx.callee_arg_names.index(name)
+        except ValueError:
+            return default
+        if len(ctx.arg_types[idx]) == 0:
+            return default
+        arg = get_proper_type(ctx.arg_types[idx][0])
+        if isinstance(arg, Instance) and arg.last_known_value is not None:
+            arg = arg.last_known_value
+        if isinstance(arg, LiteralType) and isinstance(arg.value, bool):
+            return arg.value
+        return None
+
+
+class _TypeReplacer(TypeTranslator):
+    def __init__(self, old: Type, new: Type) -> None:
+        super().__init__()
+        self._old = old
+        self._new = new
+
+    def visit_instance(self, t: Instance) -> Type:
+        if t == self._old:
+            return self._new
+        return super().visit_instance(t)
+
+    def visit_type_alias_type(self, t: TypeAliasType) -> Type:
+        return t.copy_modified(args=[a.accept(self) for a in t.args])
+
+
+def _replace_element(parser: Instance, element: Instance) -> None:
+    """Replace element subscript of parser in place, along with the
+    element inside other subscripts, like event tuples of pull parsers"""
+    if not parser.args:
+        parser.args = (element,)
+        return
+    old, *rest = parser.args
+    replacer = _TypeReplacer(old, element)
+    parser.args = (element, *(t.accept(replacer) for t in rest))
+
+
+def _first_str_expr(
+    call: CallExpr | None, arg_names: tuple[str | None, ...]
+) -> str | None:
+    """String literal passed as first argument of call expression"""
+    if not (
+        call is not None
+        and call.args
+        and call.arg_names[0] in arg_names
+        and isinstance(call.args[0], StrExpr)
     ):
-        arg = cast(Instance, lookup.args[0])
-    if arg:
-        ctx.type.args = (arg,)
+        return None
+    return call.args[0].value
 
-    return ctx.default_return_type
+
+def _bool_expr(call: CallExpr, name: str, default: bool) -> bool | None:
+    """Value of bool keyword argument in call expression,
+    None if not a literal"""
+    for arg_name, arg in zip(call.arg_names, call.args):
+        if arg_name == name:
+            if isinstance(arg, NameExpr) and arg.fullname in (
+                "builtins.True",
+                "builtins.False",
+            ):
+                return arg.fullname == "builtins.True"
+            return None
+    return default
 
 
 def plugin(_: str) -> type[MypyLxmlPlugin]:
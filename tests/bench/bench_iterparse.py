@@ -0,0 +1,40 @@
+"""iterparse() with and without `tag` filtering"""
+
+from __future__ import annotations
+
+import io
+from typing import TYPE_CHECKING
+
+from lxml.etree import iterparse
+
+if TYPE_CHECKING:
+    from conftest import Bench
+
+_GROUP = "iterparse: collect <a> elements"
+
+
+def test_tag_filter(bench: Bench, bightml_bytes: bytes) -> None:
+    def run() -> int:
+        walker = iterparse(io.BytesIO(bightml_bytes), html=True, tag="a")
+        return sum(1 for _ in walker)
+
+    assert bench(_GROUP, run) > 0
+
+
+def test_python_filter(bench: Bench, bightml_bytes: bytes) -> None:
+    def run() -> int:
+        walker = iterparse(io.BytesIO(bightml_bytes), html=True)
+        return sum(1 for _, elem in walker if elem.tag == "a")
+
+    assert bench(_GROUP, run) > 0
+
+
+def test_tag_filter_clear(bench: Bench, bightml_bytes: bytes) -> None:
+    def run() -> int:
+        count = 0
+        for _, elem in iterparse(io.BytesIO(bightml_bytes), html=True, tag="a"):
+            count += 1
+            elem.clear(keep_tail=True)
+        return count
+
+    assert bench(_GROUP, run) > 0
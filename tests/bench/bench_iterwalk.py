@@ -0,0 +1,41 @@
+"""iterwalk() with and without skip_subtree()"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from lxml.etree import iterwalk
+from lxml.html import HtmlElement
+
+if TYPE_CHECKING:
+    from conftest import Bench
+
+_GROUP = "iterwalk: elements outside <table>"
+
+
+def test_skip_subtree(bench: Bench, bightml_root: HtmlElement) -> None:
+    def run() -> int:
+        count = 0
+        walker = iterwalk(bightml_root, events=("start",))
+        for _, elem in walker:
+            if elem.tag == "table":
+                walker.skip_subtree()
+            else:
+                count += 1
+        return count
+
+    assert bench(_GROUP, run) > 0
+
+
+def test_ancestor_check(bench: Bench, bightml_root: HtmlElement) -> None:
+    def run() -> int:
+        count = 0
+        for _, elem in iterwalk(bightml_root, events=("start",)):
+            if elem.tag == "table":
+                continue
+            if any(a.tag == "table" for a in elem.iterancestors()):
+                continue
+            count += 1
+        return count
+
+    assert bench(_GROUP, run) > 0
@@ -0,0 +1,43 @@
+"""Incremental serialisation with xmlfile against tostring()"""
+
+from __future__ import annotations
+
+import io
+from typing import TYPE_CHECKING
+
+from lxml.etree import tostring, xmlfile
+from lxml.html import HtmlElement
+
+if TYPE_CHECKING:
+    from conftest import Bench
+
+_GROUP = "xmlfile: serialise document"
+
+
+def test_tostring(bench: Bench, bightml_root: HtmlElement) -> None:
+    def run() -> int:
+        return len(tostring(bightml_root))
+
+    assert bench(_GROUP, run) > 0
+
+
+def test_xmlfile_per_child(bench: Bench, bightml_root: HtmlElement) -> None:
+    def run() -> int:
+        out = io.BytesIO()
+        with xmlfile(out) as xf, xf.element(bightml_root.tag):
+            for child in bightml_root:
+                xf.write(child)
+        return len(out.getvalue())
+
+    assert bench(_GROUP, run) > 0
+
+
+def test_xmlfile_per_child_unbuffered(bench: Bench, bightml_root: HtmlElement) -> None:
+    def run() -> int:
+        out = io.BytesIO()
+        with xmlfile(out, buffered=False) as xf, xf.element(bightml_root.tag):
+            for child in bightml_root:
+                xf.write(child)
+        return len(out.getvalue())
+
+    assert bench(_GROUP, run) > 0
@@ -0,0 +1,42 @@
+"""Compiled XPath objects against _Element.xpath()"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from lxml.etree import XPath
+from lxml.html import HtmlElement
+
+if TYPE_CHECKING:
+    from conftest import Bench
+
+_GROUP = "xpath: link targets, repeated evaluation"
+_EXPR = "//a/@href"
+_REPEAT = 20
+
+
+def test_element_xpath(bench: Bench, bightml_root: HtmlElement) -> None:
+    def run() -> int:
+        return sum(len(bightml_root.xpath(_EXPR)) for _ in range(_REPEAT))
+
+    assert bench(_GROUP, run) > 0
+
+
+def test_compiled_xpath(bench: Bench, bightml_root: HtmlElement) -> None:
+    find = XPath(_EXPR)
+
+    def run() -> int:
+        return sum(len(find(bightml_root)) for _ in range(_REPEAT))
+
+    assert bench(_GROUP, run) > 0
+
+
+def test_compiled_xpath_no_smart_strings(
+    bench: Bench, bightml_root: HtmlElement
+) -> None:
+    find = XPath(_EXPR, smart_strings=False)
+
+    def run() -> int:
+        return sum(len(find(bightml_root)) for _ in range(_REPEAT))
+
+    assert bench(_GROUP, run) > 0
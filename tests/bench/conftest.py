@@ -0,0 +1,153 @@
+"""Runtime benchmark of lxml usage patterns covered by stub overloads.
+
+Benchmarks live in `bench_*.py` files, which are not collected by
+default; run them explicitly with::
+
+    pytest -o python_files='bench_*.py' tests/bench
+    tox run -m bench
+
+Each benchmark times alternative ways of doing the same job against
+the big HTML sample shared with runtime tests, and a markdown table
+comparing them within each group is printed at the end of session.
+"""
+
+from __future__ import annotations
+
+import json
+import lzma
+import statistics
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Protocol, TypeVar
+
+import pytest
+from lxml import etree as _e, html as _h
+
+_T = TypeVar("_T")
+
+_BIGHTML_PATH = (
+    Path(__file__).resolve().parents[1] / "runtime" / "_data" / "sample.html.xz"
+)
+
+
+class Bench(Protocol):
+    """Type of `bench` fixture"""
+
+    def __call__(self, group: str, func: Callable[[], _T], /) -> _T: ...
+
+
+@dataclass
+class Result:
+    group: str
+    case: str
+    best: float
+    median: float
+    rounds: int
+
+
+_results: list[Result] = []
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("bench", "runtime benchmark")
+    group.addoption(
+        "--bench-rounds",
+        type=int,
+        default=20,
+        help="Timed runs per benchmark case (default: %(default)s)",
+    )
+    group.addoption(
+        "--bench-json",
+        type=Path,
+        help="Also save raw benchmark results as JSON",
+    )
+
+
+# Same content as fixtures of the same name in runtime tests,
+# minus the type checking machinery loaded by runtime conftest
+@pytest.fixture(scope="session")
+def bightml_bytes() -> bytes:
+    with lzma.open(_BIGHTML_PATH, "rb") as f:
+        result = f.read()
+    return result
+
+
+# Benchmarks never modify the tree, so it is parsed only once
+@pytest.fixture(scope="session")
+def bightml_tree(bightml_bytes: bytes) -> _e._ElementTree[_h.HtmlElement]:
+    return _h.fromstring(bightml_bytes).getroottree()
+
+
+@pytest.fixture(scope="session")
+def bightml_root(bightml_tree: _e._ElementTree[_h.HtmlElement]) -> _h.HtmlElement:
+    return bightml_tree.getroot()
+
+
+@pytest.fixture
+def bench(request: pytest.FixtureRequest) -> Bench:
+    """Time a callable for configured number of rounds after a warm
+    up run, returning result of last run for sanity checks"""
+    rounds: int = request.config.getoption("--bench-rounds")
+    case = request.function.__name__.removeprefix("test_")
+
+    def _run(group: str, func: Callable[[], _T], /) -> _T:
+        # Untimed warm up run
+        result = func()
+        timings: list[float] = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            result = func()
+            timings.append(time.perf_counter() - start)
+        _results.append(
+            Result(group, case, min(timings), statistics.median(timings), rounds)
+        )
+        return result
+
+    return _run
+
+
+def format_table(results: list[Result]) -> str:
+    """Produce markdown table, with each case relative to the fastest
+    one in the same group"""
+    lines = [
+        "| Group | Case | Best (ms) | Median (ms) | Relative |",
+        "| --- | --- | ---: | ---: | ---: |",
+    ]
+    fastest: dict[str, float] = {}
+    for r in results:
+        fastest[r.group] = min(fastest.get(r.group, r.best), r.best)
+    for r in sorted(results, key=lambda r: (r.group, r.best)):
+        lines.append(
+            "| {} | {} | {:.2f} | {:.2f} | {:.2f}x |".format(
+                r.group,
+                r.case,
+                r.best * 1000,
+                r.median * 1000,
+                r.best / fastest[r.group],
+            )
+        )
+    return "\n".join(lines)
+
+
+def pytest_terminal_summary(
+    terminalreporter: pytest.TerminalReporter, config: pytest.Config
+) -> None:
+    if not _results:
+        return
+    terminalreporter.section("lxml {} runtime benchmark".format(_e.__version__))
+    terminalreporter.write_line(format_table(_results))
+    path: Path | None = config.getoption("--bench-json")
+    if path is not None:
+        path.write_text(
+            json.dumps(
+                {
+                    "lxml": _e.__version__,
+                    "libxml2": ".".join(map(str, _e.LIBXML_VERSION)),
+                    "results": [asdict(r) for r in _results],
+                },
+                indent=2,
+            ),
+            encoding="utf-8",
+        )
@@ -0,0 +1,174 @@
+"""Measure type checker wall clock time and peak memory against the stubs.
+
+A fixed synthetic corpus (see `corpus.py`) is written to a temporary
+directory, one slice per stub module. Every selected checker analyses
+a baseline slice containing only the common imports, then each module
+slice in turn. Differences against baseline are reported as the cost
+that the corresponding stub module adds to a type checking run.
+
+Usage (from repository root)::
+
+    python tests/perf/bench_checkers.py --checker mypy --checker pyright
+    python tests/perf/bench_checkers.py --json result.json > table.md
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from checkers import Checker, Measurement, select_checkers
+from corpus import ALIASES, SNIPPETS, write_corpus
+
+BASELINE = "(baseline)"
+FULL = "(all modules)"
+
+
+@dataclass
+class Result:
+    checker: str
+    slice: str
+    wall: float
+    maxrss_kib: int
+    returncode: int
+
+
+def measure(
+    checker: Checker,
+    corpus_dir: Path,
+    repeat: int,
+) -> tuple[float, int, Measurement]:
+    """Run checker repeatedly, returning median time and max RSS"""
+    runs = [checker.run(corpus_dir) for _ in range(repeat)]
+    wall = statistics.median(r.wall for r in runs)
+    rss = max(r.maxrss_kib for r in runs)
+    return wall, rss, runs[-1]
+
+
+def run_benchmark(
+    checkers: Sequence[Checker],
+    modules: Sequence[str],
+    copies: int,
+    repeat: int,
+    verbose: bool = False,
+) -> list[Result]:
+    results: list[Result] = []
+    slices: list[tuple[str, list[str] | None]] = [(BASELINE, None)]
+    slices.extend((m, [m]) for m in modules)
+    if len(modules) > 1:
+        slices.append((FULL, list(modules)))
+
+    with tempfile.TemporaryDirectory(prefix="lxml-perf-") as tmp:
+        for name, mods in slices:
+            corpus_dir = Path(tmp) / str(len(results))
+            write_corpus(corpus_dir, mods, copies)
+            for checker in checkers:
+                wall, rss, last = measure(checker, corpus_dir, repeat)
+                if last.returncode != 0:
+                    print(
+                        "WARNING: {} reported errors on slice {}".format(
+                            checker.name, name
+                        ),
+                        file=sys.stderr,
+                    )
+                    if verbose:
+                        print(last.output, file=sys.stderr)
+                results.append(Result(checker.name, name, wall, rss, last.returncode))
+                print(
+                    "{:>12} {:<24} {:8.2f}s {:8.1f}MiB".format(
+                        checker.name, name, wall, rss / 1024
+                    ),
+                    file=sys.stderr,
+                )
+    return results
+
+
+def format_table(results: Sequence[Result]) -> str:
+    """Produce markdown table, with module cost relative to baseline"""
+    checkers = list(dict.fromkeys(r.checker for r in results))
+    slices = list(dict.fromkeys(r.slice for r in results))
+    lookup = {(r.checker, r.slice): r for r in results}
+
+    header = "| Stub module | " + " | ".join(checkers) + " |"
+    lines = [header, "| --- |" + " ---: |" * len(checkers)]
+    for s in slices:
+        cells: list[str] = []
+        for c in checkers:
+            r = lookup.get((c, s))
+            base = lookup.get((c, BASELINE))
+            if r is None or base is None:
+                cells.append("n/a")
+            elif s == BASELINE:
+                cells.append("{:.2f}s / {:.0f}MiB".format(r.wall, r.maxrss_kib / 1024))
+            else:
+                cells.append(
+                    "{:+.2f}s / {:+.0f}MiB".format(
+                        r.wall - base.wall,
+                        (r.maxrss_kib - base.maxrss_kib) / 1024,
+                    )
+                )
+            if r is not None and r.returncode != 0:
+                cells[-1] += " (!)"
+        lines.append("| {} | {} |".format(ALIASES.get(s, s), " | ".join(cells)))
+    return "\n".join(lines)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "-c",
+        "--checker",
+        action="append",
+        help="Type checker to run; can be repeated (default: all installed)",
+    )
+    parser.add_argument(
+        "-m",
+        "--module",
+        action="append",
+        choices=sorted(SNIPPETS),
+        help="Stub module slice to measure; can be repeated (default: all)",
+    )
+    parser.add_argument(
+        "--copies",
+        type=int,
+        default=10,
+        help="Number of duplicated files per corpus slice (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Runs per measurement, median time is taken (default: %(default)s)",
+    )
+    parser.add_argument("--json", type=Path, help="Also save raw results as JSON")
+    parser.add_argument(
+        "-v", "--verbose", action="store_true", help="Show checker errors"
+    )
+    args = parser.parse_args(argv)
+
+    checkers = select_checkers(args.checker)
+    if not checkers:
+        parser.error("No type checker available")
+    results = run_benchmark(
+        checkers,
+        args.module or list(SNIPPETS),
+        args.copies,
+        args.repeat,
+        args.verbose,
+    )
+    if args.json:
+        args.json.write_text(
+            json.dumps([asdict(r) for r in results], indent=2), encoding="utf-8"
+        )
+    print(format_table(results))
+    return 0 if all(r.returncode == 0 for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
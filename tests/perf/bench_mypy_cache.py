@@ -0,0 +1,253 @@
+"""Report how stub changes invalidate mypy incremental cache downstream.
+
+mypy records an interface hash for every module in its cache. When a
+module changes, modules depending on it are only re-checked if the
+interface hash changes too. This harness builds a cache against the
+stubs of an earlier release, then re-runs mypy against the current
+tree with that cache, and reports:
+
+- which `lxml-stubs` modules changed source and/or interface
+- how many corpus modules mypy had to re-check as a consequence
+
+Internal refactors which keep all interface hashes intact are free
+for users of mypy incremental mode; the others force re-checking of
+every module importing `lxml`, directly or not.
+
+Usage (from repository root)::
+
+    python tests/perf/bench_mypy_cache.py --baseline 2026.02.16
+    python tests/perf/bench_mypy_cache.py --baseline types-lxml==2026.2.16
+    python tests/perf/bench_mypy_cache.py --baseline path/to/old/src
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import zipfile
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from checkers import PYTHON_VERSION, STUB_ROOT, _write_mypy_config
+from corpus import SNIPPETS, write_corpus
+
+_STALE_SCC_RE = re.compile(
+    r"^LOG:  (?:Scheduling|Processing) SCC (?:singleton|of size \d+) "
+    r"\(([^)]*)\) as (?:inherently )?stale",
+    re.MULTILINE,
+)
+
+
+@dataclass
+class CacheEntry:
+    path: str
+    source_hash: str
+    interface_hash: str
+
+
+@dataclass
+class CacheReport:
+    baseline: str
+    # Stub modules with changed source, and whether interface changed
+    changed_stubs: dict[str, bool] = field(default_factory=dict[str, bool])
+    added_stubs: list[str] = field(default_factory=list[str])
+    removed_stubs: list[str] = field(default_factory=list[str])
+    corpus_modules: int = 0
+    rechecked: list[str] = field(default_factory=list[str])
+
+    @property
+    def interface_changed(self) -> list[str]:
+        return sorted(m for m, changed in self.changed_stubs.items() if changed)
+
+
+def prepare_baseline(spec: str, dest: Path) -> Path:
+    """Produce directory containing `lxml-stubs` of earlier release
+
+    The baseline can be a directory (either `lxml-stubs` itself or
+    its parent), a `types-lxml==VERSION` requirement fetched from PyPI,
+    or any git revision of this repository.
+    """
+    path = Path(spec).resolve()
+    if path.is_dir():
+        if path.name == "lxml-stubs":
+            return path.parent
+        if (path / "lxml-stubs").is_dir():
+            return path
+        raise ValueError("No lxml-stubs directory found in {}".format(path))
+
+    dest.mkdir(parents=True)
+    if "==" in spec:
+        subprocess.run(
+            [sys.executable, "-m", "pip", "download", "--no-deps", "-q"]
+            + ["--only-binary=:all:", "-d", str(dest), spec],
+            check=True,
+        )
+        (wheel,) = dest.glob("*.whl")
+        with zipfile.ZipFile(wheel) as zf:
+            zf.extractall(dest)
+        return dest
+
+    repo = STUB_ROOT.parent
+    archive = subprocess.run(
+        ["git", "archive", spec, "src/lxml-stubs"],
+        cwd=repo,
+        stdout=subprocess.PIPE,
+        check=True,
+    ).stdout
+    subprocess.run(["tar", "-x", "-C", str(dest)], input=archive, check=True)
+    return dest / "src"
+
+
+def run_mypy(corpus_dir: Path, cache_dir: Path) -> str:
+    proc = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "mypy",
+            "--config-file=mypy.ini",
+            "--cache-dir={}".format(cache_dir),
+            "--no-error-summary",
+            "--verbose",
+            ".",
+        ],
+        cwd=corpus_dir,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    if proc.returncode not in (0, 1):  # 1 = type errors, still cached
+        raise RuntimeError(proc.stdout[-2000:])
+    return proc.stdout
+
+
+def read_cache(cache_dir: Path) -> dict[str, CacheEntry]:
+    result: dict[str, CacheEntry] = {}
+    for meta in (cache_dir / PYTHON_VERSION).rglob("*.meta.json"):
+        data = json.loads(meta.read_text(encoding="utf-8"))
+        result[data["id"]] = CacheEntry(
+            data["path"], data["hash"], data["interface_hash"]
+        )
+    return result
+
+
+def _is_stub(name: str) -> bool:
+    return name == "lxml" or name.startswith("lxml.")
+
+
+def compare_cache(
+    baseline: str,
+    corpus_dir: Path,
+    before: dict[str, CacheEntry],
+    after: dict[str, CacheEntry],
+    stale: set[str],
+) -> CacheReport:
+    report = CacheReport(baseline)
+    old_stubs = {m for m in before if _is_stub(m)}
+    if not old_stubs:
+        raise RuntimeError("Baseline stubs were not picked up by mypy")
+    new_stubs = {m for m in after if _is_stub(m)}
+    report.added_stubs = sorted(new_stubs - old_stubs)
+    report.removed_stubs = sorted(old_stubs - new_stubs)
+    for name in sorted(old_stubs & new_stubs):
+        old, new = before[name], after[name]
+        if old.source_hash != new.source_hash:
+            report.changed_stubs[name] = old.interface_hash != new.interface_hash
+
+    corpus = {
+        name
+        for name, entry in after.items()
+        if (corpus_dir / entry.path).resolve().is_relative_to(corpus_dir.resolve())
+    }
+    report.corpus_modules = len(corpus)
+    report.rechecked = sorted(corpus & stale)
+    return report
+
+
+def measure(baseline: str, corpus_dir: Path, work_dir: Path) -> CacheReport:
+    cache_dir = work_dir / "mypy-cache"
+    old_root = prepare_baseline(baseline, work_dir / "baseline")
+
+    _write_mypy_config(corpus_dir, old_root)
+    run_mypy(corpus_dir, cache_dir)
+    before = read_cache(cache_dir)
+
+    _write_mypy_config(corpus_dir, STUB_ROOT)
+    output = run_mypy(corpus_dir, cache_dir)
+    after = read_cache(cache_dir)
+
+    stale = {name for scc in _STALE_SCC_RE.findall(output) for name in scc.split()}
+    return compare_cache(baseline, corpus_dir, before, after, stale)
+
+
+def format_report(report: CacheReport) -> str:
+    lines = [
+        "Baseline: `{}`".format(report.baseline),
+        "",
+        "| Stub module | Source | Interface |",
+        "| --- | --- | --- |",
+    ]
+    for name, iface in report.changed_stubs.items():
+        lines.append(
+            "| `{}` | changed | {} |".format(name, "**changed**" if iface else "same")
+        )
+    for name in report.added_stubs:
+        lines.append("| `{}` | added | **added** |".format(name))
+    for name in report.removed_stubs:
+        lines.append("| `{}` | removed | **removed** |".format(name))
+    lines += [
+        "",
+        "Corpus modules re-checked: {} of {}".format(
+            len(report.rechecked), report.corpus_modules
+        ),
+    ]
+    return "\n".join(lines)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "-b",
+        "--baseline",
+        required=True,
+        help="Earlier stubs to build cache against: git revision, "
+        "'types-lxml==VERSION' from PyPI, or directory",
+    )
+    parser.add_argument(
+        "--copies",
+        type=int,
+        default=1,
+        help="Number of duplicated files per corpus slice (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--source",
+        type=Path,
+        help="Directory of Python sources to use as corpus, "
+        "instead of the built-in synthetic corpus",
+    )
+    parser.add_argument("--json", type=Path, help="Also save report as JSON")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="lxml-perf-") as tmp:
+        corpus_dir = Path(tmp) / "corpus"
+        if args.source:
+            shutil.copytree(args.source, corpus_dir)
+        else:
+            write_corpus(corpus_dir, list(SNIPPETS), args.copies)
+        report = measure(args.baseline, corpus_dir, Path(tmp))
+
+    if args.json:
+        data = asdict(report)
+        data["interface_changed"] = report.interface_changed
+        args.json.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    print(format_report(report))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
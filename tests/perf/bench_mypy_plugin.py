@@ -0,0 +1,254 @@
+"""Measure the cost of enabling the bundled mypy plugin globally.
+
+The plugin hooks are consulted by mypy for every method call in the
+whole program, not only the ones involving `lxml`. This benchmark
+type checks a large synthetic corpus where only a small fraction of
+modules use `lxml`, and reports:
+
+- total mypy time with and without the plugin enabled
+- number of `get_method_hook()` calls and time spent inside the
+  plugin, measured by instrumenting the plugin in-process
+
+Time measured by instrumentation includes the timer overhead itself,
+therefore is an upper bound of the plugin's actual share.
+
+Usage (from repository root)::
+
+    python tests/perf/bench_mypy_plugin.py
+    python tests/perf/bench_mypy_plugin.py --modules 1000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import textwrap
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+from checkers import STUB_ROOT, _write_mypy_config
+from corpus import SNIPPETS, write_corpus
+
+# Plain Python code with plenty of method calls but nothing lxml related
+_GENERIC_MODULE = """\
+from __future__ import annotations
+
+from collections import defaultdict
+
+
+class Record{i}:
+    def __init__(self, name: str, values: list[int]) -> None:
+        self.name = name
+        self.values = values
+
+    def total(self) -> int:
+        return sum(self.values)
+
+    def scaled(self, factor: float) -> list[float]:
+        return [v * factor for v in self.values]
+
+    def label(self) -> str:
+        return self.name.strip().lower().replace(" ", "_")
+
+
+class Scaler{i}:
+    def __init__(self, factor: float) -> None:
+        self.factor = factor
+
+    def __call__(self, value: int) -> float:
+        return value * self.factor
+
+
+def summarize{i}(records: list[Record{i}]) -> dict[str, list[int]]:
+    result: defaultdict[str, list[int]] = defaultdict(list)
+    scale = Scaler{i}(0.5)
+    for rec in records:
+        key = rec.label()
+        result[key].append(rec.total())
+        result[key].extend(int(x) for x in rec.scaled(0.5))
+        result[key].extend(int(scale(x)) for x in rec.values)
+        if key.startswith("x") and key.endswith("y"):
+            result[key].sort()
+    names = ",".join(sorted(result.keys()))
+    _ = names.split(",")[0].upper().encode("utf-8").decode()
+    return dict(result)
+"""
+
+_RUN_SCRIPT = """\
+import json, sys, time
+from mypy import api
+start = time.perf_counter()
+api.run(sys.argv[1:])
+json.dump({"wall": time.perf_counter() - start}, sys.stdout)
+"""
+
+# Run in a child process: mypy is run in-process with instrumented
+# plugin, then statistics are dumped as JSON
+_INSTRUMENT_SCRIPT = """\
+import json, sys, time
+from mypy import api
+from mypy_plugin_lxml import main
+
+stats = {"lookups": 0, "lookup_time": 0.0, "hook_calls": 0, "hook_time": 0.0}
+clock = time.perf_counter
+orig_get_method_hook = main.MypyLxmlPlugin.get_method_hook
+
+def timed_hook(hook):
+    def wrapper(ctx):
+        start = clock()
+        try:
+            return hook(ctx)
+        finally:
+            stats["hook_calls"] += 1
+            stats["hook_time"] += clock() - start
+    return wrapper
+
+def get_method_hook(self, fullname):
+    start = clock()
+    hook = orig_get_method_hook(self, fullname)
+    stats["lookup_time"] += clock() - start
+    stats["lookups"] += 1
+    return None if hook is None else timed_hook(hook)
+
+main.MypyLxmlPlugin.get_method_hook = get_method_hook
+start = clock()
+api.run(sys.argv[1:])
+stats["wall"] = clock() - start
+json.dump(stats, sys.stdout)
+"""
+
+_MYPY_ARGS = [
+    "--config-file=mypy.ini",
+    "--cache-dir=" + os.devnull,
+    "--no-error-summary",
+    ".",
+]
+
+
+@dataclass
+class PluginReport:
+    modules: int
+    lxml_modules: int
+    wall_without: float
+    wall_with: float
+    lookups: int
+    lookup_time: float
+    hook_calls: int
+    hook_time: float
+    instrumented_wall: float
+
+    @property
+    def plugin_share(self) -> float:
+        return (self.lookup_time + self.hook_time) / self.instrumented_wall
+
+
+def write_plugin_corpus(dest: Path, modules: int) -> int:
+    """Write generic modules plus one copy of each lxml snippet
+
+    Returns number of lxml using modules written.
+    """
+    lxml_files = write_corpus(dest, list(SNIPPETS), 1)
+    for i in range(modules - len(lxml_files)):
+        (dest / "generic_{:04d}.py".format(i)).write_text(
+            _GENERIC_MODULE.format(i=i), encoding="utf-8"
+        )
+    return len(lxml_files)
+
+
+def configure(corpus_dir: Path, plugin: bool) -> None:
+    _write_mypy_config(corpus_dir, STUB_ROOT)
+    if plugin:
+        with open(corpus_dir / "mypy.ini", "a", encoding="utf-8") as f:
+            f.write("plugins = mypy_plugin_lxml.main\n")
+
+
+def time_mypy(corpus_dir: Path, plugin: bool) -> float:
+    configure(corpus_dir, plugin)
+    proc = subprocess.run(
+        [sys.executable, "-c", _RUN_SCRIPT, *_MYPY_ARGS],
+        cwd=corpus_dir,
+        stdout=subprocess.PIPE,
+        check=True,
+    )
+    wall: float = json.loads(proc.stdout)["wall"]
+    return wall
+
+
+def instrument(corpus_dir: Path) -> dict[str, float]:
+    configure(corpus_dir, True)
+    proc = subprocess.run(
+        [sys.executable, "-c", _INSTRUMENT_SCRIPT, *_MYPY_ARGS],
+        cwd=corpus_dir,
+        stdout=subprocess.PIPE,
+        check=True,
+    )
+    result: dict[str, float] = json.loads(proc.stdout)
+    return result
+
+
+def run_benchmark(modules: int, repeat: int) -> PluginReport:
+    with tempfile.TemporaryDirectory(prefix="lxml-perf-") as tmp:
+        corpus_dir = Path(tmp) / "corpus"
+        lxml_modules = write_plugin_corpus(corpus_dir, modules)
+        # Interleave runs to spread out system noise evenly
+        without: list[float] = []
+        with_plugin: list[float] = []
+        for _ in range(repeat):
+            without.append(time_mypy(corpus_dir, False))
+            with_plugin.append(time_mypy(corpus_dir, True))
+        stats = instrument(corpus_dir)
+    return PluginReport(
+        modules=modules,
+        lxml_modules=lxml_modules,
+        wall_without=statistics.median(without),
+        wall_with=statistics.median(with_plugin),
+        lookups=int(stats["lookups"]),
+        lookup_time=stats["lookup_time"],
+        hook_calls=int(stats["hook_calls"]),
+        hook_time=stats["hook_time"],
+        instrumented_wall=stats["wall"],
+    )
+
+
+def format_report(r: PluginReport) -> str:
+    return textwrap.dedent(f"""\
+        Corpus: {r.modules} modules, {r.lxml_modules} of them using lxml
+
+        | Measurement | Value |
+        | --- | ---: |
+        | mypy time without plugin | {r.wall_without:.2f}s |
+        | mypy time with plugin | {r.wall_with:.2f}s |
+        | `get_method_hook()` calls | {r.lookups} |
+        | Time inside `get_method_hook()` | {r.lookup_time * 1000:.2f}ms |
+        | Method hook calls | {r.hook_calls} |
+        | Time inside method hooks | {r.hook_time * 1000:.2f}ms |
+        | Plugin share of mypy time | {r.plugin_share:.3%} |""")
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--modules",
+        type=int,
+        default=400,
+        help="Total number of corpus modules (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Runs per measurement, median time is taken (default: %(default)s)",
+    )
+    args = parser.parse_args(argv)
+    print(format_report(run_benchmark(args.modules, args.repeat)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,312 @@
+"""Report how many overload candidates type checkers evaluate per call site.
+
+None of the supported checkers expose overload resolution statistics,
+so they are derived by probing. For each overloaded stub symbol, a
+scratch copy of the stubs is modified to keep only the first `k`
+overloads, and the corpus is checked again for every `k`. A call site
+which starts failing when `k` drops below `i` is resolved by overload
+`i`, which means checkers went through `i` candidates before finding
+the match. Call sites themselves are discovered by replacing the whole
+overload group with a signature that never matches.
+
+Checkers do filter candidates by argument count before full evaluation,
+so the numbers here are an upper bound of the actual work done. They
+are nevertheless good indication of which overload lists would benefit
+from reordering.
+
+Usage (from repository root)::
+
+    python tests/perf/bench_overloads.py --checker pyright
+    python tests/perf/bench_overloads.py --symbol etree/_module_func.pyi:tostring
+    python tests/perf/bench_overloads.py --source path/to/project
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import re
+import shutil
+import sys
+import tempfile
+from collections import Counter
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from checkers import STUB_ROOT, Checker, select_checkers
+from corpus import SNIPPETS, write_corpus
+
+# Error locations in corpus files, as printed by any supported checker.
+# Stub files (.pyi) mentioned in notes are deliberately not matched.
+_LOCATION_RE = re.compile(r"([^\s:]+\.py):(\d+)\b")
+
+_PROBE_IMPORT = "\nimport typing as _lxml_perf_typing\n"
+
+
+@dataclass
+class OverloadSymbol:
+    path: str  # relative to lxml-stubs directory
+    qualname: str
+    count: int
+
+    def __str__(self) -> str:
+        return "{}:{}".format(self.path, self.qualname)
+
+    @property
+    def call_hint(self) -> str | None:
+        """Name expected to appear on call site lines, if known"""
+        *parents, name = self.qualname.split(".")
+        if name in {"__new__", "__init__"}:
+            return parents[-1]
+        if name.startswith("__"):
+            return None
+        return name
+
+
+@dataclass
+class SymbolReport:
+    symbol: OverloadSymbol
+    checker: str
+    # Number of call sites resolved by each overload (1-based)
+    matched: Counter[int] = field(default_factory=Counter[int])
+
+    @property
+    def sites(self) -> int:
+        return sum(self.matched.values())
+
+    @property
+    def evaluations(self) -> int:
+        return sum(idx * n for idx, n in self.matched.items())
+
+
+def _is_overload(node: ast.FunctionDef) -> bool:
+    return any(
+        (isinstance(d, ast.Name) and d.id == "overload")
+        or (isinstance(d, ast.Attribute) and d.attr == "overload")
+        for d in node.decorator_list
+    )
+
+
+def _walk_overloads(
+    body: list[ast.stmt], prefix: str = ""
+) -> Iterator[tuple[str, list[ast.FunctionDef]]]:
+    groups: dict[str, list[ast.FunctionDef]] = {}
+    for node in body:
+        if isinstance(node, ast.ClassDef):
+            yield from _walk_overloads(node.body, prefix + node.name + ".")
+        elif isinstance(node, ast.FunctionDef) and _is_overload(node):
+            groups.setdefault(node.name, []).append(node)
+    for name, nodes in groups.items():
+        yield prefix + name, nodes
+
+
+def discover_symbols(min_count: int) -> list[OverloadSymbol]:
+    found: list[OverloadSymbol] = []
+    stub_dir = STUB_ROOT / "lxml-stubs"
+    for path in sorted(stub_dir.rglob("*.pyi")):
+        tree = ast.parse(path.read_text(encoding="utf-8"))
+        for qualname, nodes in _walk_overloads(tree.body):
+            if len(nodes) >= min_count:
+                found.append(
+                    OverloadSymbol(
+                        path.relative_to(stub_dir).as_posix(), qualname, len(nodes)
+                    )
+                )
+    return found
+
+
+def parse_symbol(spec: str) -> OverloadSymbol:
+    path, sep, qualname = spec.partition(":")
+    if not sep:
+        raise ValueError("Symbol must be in form of 'path/to/file.pyi:qualname'")
+    source = (STUB_ROOT / "lxml-stubs" / path).read_text(encoding="utf-8")
+    for name, nodes in _walk_overloads(ast.parse(source).body):
+        if name == qualname:
+            return OverloadSymbol(path, qualname, len(nodes))
+    raise ValueError("No overloaded function {} found".format(spec))
+
+
+def truncate_overloads(source: str, qualname: str, keep: int) -> str:
+    """Keep only first `keep` overloads of function in stub source
+
+    When `keep` is 0, the whole overload group is replaced with a
+    probe signature which no call can possibly match.
+    """
+    nodes = dict(_walk_overloads(ast.parse(source).body))[qualname]
+    lines = source.splitlines(keepends=True)
+
+    def span(node: ast.FunctionDef) -> tuple[int, int]:
+        start = min([node.lineno] + [d.lineno for d in node.decorator_list])
+        assert node.end_lineno is not None
+        return start - 1, node.end_lineno
+
+    if keep == 0:
+        first = nodes[0]
+        indent = " " * first.col_offset
+        params = ["*", "_lxml_perf_probe: object"]
+        is_static = any(
+            isinstance(d, ast.Name) and d.id == "staticmethod"
+            for d in first.decorator_list
+        )
+        if "." in qualname and not is_static:
+            params.insert(0, (first.args.posonlyargs + first.args.args)[0].arg)
+        ret = "None" if first.name == "__init__" else "_lxml_perf_typing.Any"
+        probe = "{}def {}({}) -> {}: ...\n".format(
+            indent, first.name, ", ".join(params), ret
+        )
+        start, _ = span(nodes[0])
+        _, end = span(nodes[-1])
+        return "".join(lines[:start] + [probe] + lines[end:]) + _PROBE_IMPORT
+
+    for node in reversed(nodes[keep:]):
+        start, end = span(node)
+        del lines[start:end]
+    if keep == 1:
+        # Single @overload is an error
+        for deco in nodes[0].decorator_list:
+            if isinstance(deco, ast.Name) and deco.id == "overload":
+                lines[deco.lineno - 1] = "\n"
+    return "".join(lines)
+
+
+def error_locations(output: str, corpus_dir: Path) -> set[tuple[Path, int]]:
+    base = corpus_dir.resolve()
+    result: set[tuple[Path, int]] = set()
+    for m in _LOCATION_RE.finditer(output):
+        path = (base / m[1]).resolve()  # absolute path stays intact
+        if path.is_relative_to(base):
+            result.add((path, int(m[2])))
+    return result
+
+
+def probe_symbol(
+    checker: Checker,
+    symbol: OverloadSymbol,
+    corpus_dir: Path,
+    stub_root: Path,
+) -> SymbolReport:
+    report = SymbolReport(symbol, checker.name)
+    target = stub_root / "lxml-stubs" / symbol.path
+    original = target.read_text(encoding="utf-8")
+
+    def errors_with(keep: int) -> set[tuple[Path, int]]:
+        target.write_text(
+            truncate_overloads(original, symbol.qualname, keep), encoding="utf-8"
+        )
+        try:
+            return error_locations(
+                checker.run(corpus_dir, stub_root).output, corpus_dir
+            )
+        finally:
+            target.write_text(original, encoding="utf-8")
+
+    def is_call_site(location: tuple[Path, int]) -> bool:
+        # Errors may cascade to other lines using the result
+        if (hint := symbol.call_hint) is None:
+            return True
+        lines = location[0].read_text(encoding="utf-8").splitlines()
+        return hint in lines[location[1] - 1]
+
+    preexisting = error_locations(checker.run(corpus_dir, stub_root).output, corpus_dir)
+    sites = set(filter(is_call_site, errors_with(0) - preexisting))
+    if not sites:
+        return report
+
+    # Iterate downwards; the first truncation level where a site fails
+    # tells that it is resolved by the overload right after that
+    resolved_by = dict.fromkeys(sites, 1)
+    for keep in range(symbol.count - 1, 0, -1):
+        for site in errors_with(keep) & sites:
+            if resolved_by[site] == 1:
+                resolved_by[site] = keep + 1
+    report.matched.update(resolved_by.values())
+    return report
+
+
+def format_reports(reports: Sequence[SymbolReport]) -> str:
+    lines = [
+        "| Symbol | Overloads | Checker | Call sites | Evaluations | "
+        "Sites resolved by overload # |",
+        "| --- | ---: | --- | ---: | ---: | --- |",
+    ]
+    for r in sorted(reports, key=lambda r: (-r.evaluations, str(r.symbol))):
+        histogram = " ".join(
+            "{}:{}".format(i, r.matched[i]) for i in range(1, r.symbol.count + 1)
+        )
+        lines.append(
+            "| `{}` | {} | {} | {} | {} | {} |".format(
+                r.symbol,
+                r.symbol.count,
+                r.checker,
+                r.sites,
+                r.evaluations,
+                histogram,
+            )
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "-c",
+        "--checker",
+        action="append",
+        help="Type checker to run; can be repeated (default: all installed)",
+    )
+    parser.add_argument(
+        "-s",
+        "--symbol",
+        action="append",
+        help="Overloaded stub symbol in 'etree/_module_func.pyi:tostring' "
+        "form; can be repeated (default: all with enough overloads)",
+    )
+    parser.add_argument(
+        "--min-overloads",
+        type=int,
+        default=3,
+        help="Minimum overload count for automatic symbol discovery "
+        "(default: %(default)s)",
+    )
+    parser.add_argument(
+        "--source",
+        type=Path,
+        help="Directory of Python sources to use as corpus, "
+        "instead of the built-in synthetic corpus",
+    )
+    args = parser.parse_args(argv)
+
+    checkers = select_checkers(args.checker)
+    if not checkers:
+        parser.error("No type checker available")
+    if args.symbol:
+        symbols = [parse_symbol(s) for s in args.symbol]
+    else:
+        symbols = discover_symbols(args.min_overloads)
+
+    reports: list[SymbolReport] = []
+    with tempfile.TemporaryDirectory(prefix="lxml-perf-") as tmp:
+        stub_root = Path(tmp) / "stubs"
+        shutil.copytree(STUB_ROOT / "lxml-stubs", stub_root / "lxml-stubs")
+        corpus_dir = Path(tmp) / "corpus"
+        if args.source:
+            shutil.copytree(args.source, corpus_dir)
+        else:
+            write_corpus(corpus_dir, list(SNIPPETS), 1)
+        for symbol in symbols:
+            for checker in checkers:
+                report = probe_symbol(checker, symbol, corpus_dir, stub_root)
+                print(
+                    "{:>12} {:<48} {:4d} sites {:5d} evaluations".format(
+                        checker.name, str(symbol), report.sites, report.evaluations
+                    ),
+                    file=sys.stderr,
+                )
+                reports.append(report)
+    print(format_reports(reports))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,187 @@
+"""Type checker invocation and resource measurement helpers.
+
+Every checker is run in a fresh intermediary Python process, which
+reports back wall clock time and peak resident set size of the
+checker. Peak RSS is taken from `RUSAGE_CHILDREN`, so that checkers
+delegating actual work to another process (`pyright` spawns
+`node`) are still accounted for correctly. This requires a POSIX
+platform.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+STUB_ROOT = Path(__file__).resolve().parents[2] / "src"
+
+# Python version used by corpus analysis, shared by all checkers
+PYTHON_VERSION = "3.10"
+
+_MEASURE_SCRIPT = """\
+import json, resource, subprocess, sys, time
+start = time.perf_counter()
+proc = subprocess.run(sys.argv[1:], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+wall = time.perf_counter() - start
+rss = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+if sys.platform == "darwin":
+    rss //= 1024
+json.dump({
+    "wall": wall,
+    "maxrss_kib": rss,
+    "returncode": proc.returncode,
+    "output": proc.stdout.decode("utf-8", "replace"),
+}, sys.stdout)
+"""
+
+
+@dataclass
+class Measurement:
+    wall: float
+    maxrss_kib: int
+    returncode: int
+    output: str
+
+
+@dataclass
+class Checker:
+    name: str
+    # Returns command line when given corpus directory
+    command: Callable[[Path], list[str]]
+    # Writes configuration file(s) into corpus directory,
+    # pointing to specified stub root directory
+    configure: Callable[[Path, Path], None]
+    executable: str
+
+    def is_available(self) -> bool:
+        if self.executable == "python":
+            return True
+        return shutil.which(self.executable) is not None
+
+    def run(
+        self,
+        corpus_dir: Path,
+        stub_root: Path = STUB_ROOT,
+        extra_env: dict[str, str] | None = None,
+    ) -> Measurement:
+        self.configure(corpus_dir, stub_root)
+        env = dict(os.environ)
+        env.update(extra_env or {})
+        proc = subprocess.run(
+            [sys.executable, "-c", _MEASURE_SCRIPT, *self.command(corpus_dir)],
+            cwd=corpus_dir,
+            env=env,
+            stdout=subprocess.PIPE,
+            check=True,
+        )
+        return Measurement(**json.loads(proc.stdout))
+
+
+def _write_mypy_config(corpus_dir: Path, stub_root: Path) -> None:
+    # mypy only recognizes "-stubs" suffixed packages under site-packages,
+    # not in mypy_path. Expose stubs under plain package name instead.
+    mypy_path = corpus_dir.with_name(corpus_dir.name + "-mypy-path")
+    mypy_path.mkdir(exist_ok=True)
+    link = mypy_path / "lxml"
+    if link.is_symlink():
+        link.unlink()
+    link.symlink_to(stub_root / "lxml-stubs", target_is_directory=True)
+    (corpus_dir / "mypy.ini").write_text(
+        "[mypy]\n"
+        f"python_version = {PYTHON_VERSION}\n"
+        f"mypy_path = {mypy_path}\n"
+        "ignore_missing_imports = True\n",
+        encoding="utf-8",
+    )
+
+
+def _write_pyright_config(corpus_dir: Path, stub_root: Path) -> None:
+    # Shared by pyright and basedpyright
+    (corpus_dir / "pyrightconfig.json").write_text(
+        json.dumps({
+            "pythonVersion": PYTHON_VERSION,
+            "typeCheckingMode": "standard",
+            "extraPaths": [str(stub_root)],
+            "reportMissingModuleSource": False,
+        }),
+        encoding="utf-8",
+    )
+
+
+def _write_pyrefly_config(corpus_dir: Path, stub_root: Path) -> None:
+    (corpus_dir / "pyrefly.toml").write_text(
+        f'python-version = "{PYTHON_VERSION}"\n'
+        f"search-path = [{json.dumps(str(stub_root))}]\n",
+        encoding="utf-8",
+    )
+
+
+def _write_ty_config(corpus_dir: Path, stub_root: Path) -> None:
+    (corpus_dir / "ty.toml").write_text(
+        "[environment]\n"
+        f'python-version = "{PYTHON_VERSION}"\n'
+        f"python = {json.dumps(sys.prefix)}\n"
+        f"extra-paths = [{json.dumps(str(stub_root))}]\n",
+        encoding="utf-8",
+    )
+
+
+CHECKERS: dict[str, Checker] = {
+    c.name: c
+    for c in (
+        Checker(
+            name="mypy",
+            # Cache disabled to always measure cold analysis
+            command=lambda d: [
+                sys.executable,
+                "-m",
+                "mypy",
+                "--config-file=mypy.ini",
+                "--cache-dir=" + os.devnull,
+                "--no-error-summary",
+                ".",
+            ],
+            configure=_write_mypy_config,
+            executable="python",
+        ),
+        Checker(
+            name="pyright",
+            command=lambda d: ["pyright", "-p", "pyrightconfig.json", "."],
+            configure=_write_pyright_config,
+            executable="pyright",
+        ),
+        Checker(
+            name="basedpyright",
+            command=lambda d: ["basedpyright", "-p", "pyrightconfig.json", "."],
+            configure=_write_pyright_config,
+            executable="basedpyright",
+        ),
+        Checker(
+            name="pyrefly",
+            command=lambda d: ["pyrefly", "check", "-c", "pyrefly.toml", "."],
+            configure=_write_pyrefly_config,
+            executable="pyrefly",
+        ),
+        Checker(
+            name="ty",
+            command=lambda d: ["ty", "check", "--config-file", "ty.toml", "."],
+            configure=_write_ty_config,
+            executable="ty",
+        ),
+    )
+}
+
+
+def select_checkers(names: Sequence[str] | None) -> list[Checker]:
+    if not names:
+        return [c for c in CHECKERS.values() if c.is_available()]
+    unknown = set(names) - CHECKERS.keys()
+    if unknown:
+        raise ValueError("Unknown checker(s): {}".format(", ".join(sorted(unknown))))
+    return [CHECKERS[n] for n in names]
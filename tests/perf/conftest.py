@@ -0,0 +1,9 @@
+import sys
+from pathlib import Path
+
+# Benchmark helpers are plain modules meant to be run as scripts,
+# make them importable from tests too. Type checkers invoked by
+# pytest-revealtype-injector can't resolve these sibling imports,
+# so run tests here with `-p no:pytest-revealtype-injector`
+# (as `tox run -e perf-imports` does) if it is installed.
+sys.path.insert(0, str(Path(__file__).parent))
@@ -0,0 +1,383 @@
+"""Synthetic corpus of lxml call sites used by type checker benchmarks.
+
+Each entry of `SNIPPETS` exercises the public API declared in one
+stub module under `src/lxml-stubs`, keyed by its path relative to
+that directory (without suffix). A few extra entries stress specific
+typing constructs across modules instead. The snippets are never executed;
+they only need to type check cleanly under every supported checker,
+so that checker time is spent on resolving annotations rather than
+on error reporting.
+
+The corpus is deliberately fixed: changing any snippet invalidates
+comparison against tables published for earlier releases.
+"""
+
+from __future__ import annotations
+
+import textwrap
+from collections.abc import Iterable
+from pathlib import Path
+
+HEADER = """\
+from __future__ import annotations
+
+from io import BytesIO, StringIO
+from pathlib import Path
+
+from lxml import builder, etree, html, objectify
+from lxml.cssselect import CSSSelector
+from lxml.html import HtmlElement
+from lxml.isoschematron import Schematron
+"""
+
+SNIPPETS: dict[str, str] = {
+    "etree/_element": """
+        def use_element(root: etree._Element) -> list[str]:
+            result: list[str] = []
+            for child in root:
+                result.append(str(child.tag))
+                child.set("id", "1")
+                _ = child.get("id", "")
+                _ = child.attrib.items()
+                _ = child.text, child.tail, child.prefix, child.nsmap
+            for el in root.iter("item", "entry"):
+                _ = el.getparent()
+                _ = el.getnext(), el.getprevious()
+            for el in root.iterdescendants():
+                _ = el.sourceline
+            _ = root.find("item")
+            _ = root.findall("item")
+            _ = root.findtext("item", default="")
+            _ = list(root.itertext())
+            _ = root.makeelement("new", {"a": "b"})
+            root.append(etree.Element("x"))
+            root.insert(0, etree.Element("y"))
+            root.extend([etree.Element("z")])
+            _ = root.index(root[0])
+            _ = root.getroottree().getroot()
+            return result
+
+        def use_tree(tree: etree._ElementTree) -> None:
+            _ = tree.getroot()
+            _ = tree.docinfo.encoding
+            _ = tree.docinfo.URL
+            tree.write(BytesIO(), encoding="utf-8", xml_declaration=True)
+        """,
+    "etree/_module_func": """
+        def use_module_func(data: bytes, text: str, path: Path) -> None:
+            root = etree.fromstring(data)
+            _ = etree.fromstring(text, etree.XMLParser())
+            _ = etree.fromstring(text, html.HTMLParser())
+            _ = etree.XML(data)
+            _ = etree.HTML(text)
+            _ = etree.parse(path)
+            _ = etree.parse(BytesIO(data), etree.XMLParser(remove_blank_text=True))
+            _ = etree.fromstringlist([data, data])
+            _ = etree.tostring(root)
+            _ = etree.tostring(root, encoding="unicode", pretty_print=True)
+            _ = etree.tostring(root, encoding="utf-8", xml_declaration=True)
+            _ = etree.tostring(root, method="c14n", exclusive=True)
+            _ = etree.tostring(root, method="c14n2")
+            etree.indent(root)
+            _ = etree.iselement(root)
+        """,
+    "etree/_parser": """
+        def use_parser(data: bytes) -> None:
+            xp = etree.XMLParser(remove_blank_text=True, resolve_entities=False)
+            xp.feed(data)
+            _ = xp.close()
+            hp = etree.HTMLParser(remove_comments=True)
+            hp.feed(data)
+            _ = hp.close()
+            pp = etree.XMLPullParser(events=("start", "end"))
+            pp.feed(data)
+            for event, el in pp.read_events():
+                _ = event, el
+            _ = etree.ETCompatXMLParser()
+            _ = etree.get_default_parser()
+            _ = xp.error_log, xp.version, xp.copy()
+        """,
+    "etree/_iterparse": """
+        def use_iterparse(path: Path, root: etree._Element) -> None:
+            for _, el in etree.iterparse(path):
+                el.clear()
+            for ev1, el1 in etree.iterparse(path, ("start", "end"), tag="item"):
+                _ = ev1, el1.tag
+            for item in etree.iterparse(path, ("start-ns", "end-ns")):
+                _ = item
+            for ev2, el2 in etree.iterparse(path, html=True):
+                _ = ev2, el2
+            walker = etree.iterwalk(root, ("start", "end"))
+            for _, el3 in walker:
+                if el3.tag == "skip":
+                    walker.skip_subtree()
+        """,
+    "etree/_xpath": """
+        def use_xpath(root: etree._Element, tree: etree._ElementTree) -> None:
+            _ = root.xpath("//item")
+            _ = root.xpath("count(//item)", namespaces={"a": "urn:a"})
+            _ = tree.xpath("//item/@id")
+            find = etree.XPath("//item[@id=$v]")
+            _ = find(root, v="1")
+            _ = etree.ETXPath("//{urn:a}item")(root)
+            ev = etree.XPathEvaluator(root)
+            _ = ev("//item")
+            ev.register_namespace("a", "urn:a")
+            _ = etree.XPathEvaluator(tree)("//item")
+        """,
+    "etree/_serializer": """
+        def use_serializer(root: etree._Element, out: BytesIO, sout: StringIO) -> None:
+            with etree.xmlfile(out, encoding="utf-8") as xf:
+                xf.write_declaration()
+                with xf.element("root", {"a": "b"}):
+                    xf.write(root)
+                    xf.write("text")
+                    xf.flush()
+            with etree.htmlfile(out) as hf:
+                with hf.element("html"):
+                    hf.write(root)
+            _ = etree.canonicalize(xml_data="<a/>")
+            _ = etree.C14NWriterTarget(sout.write)
+        """,
+    "etree/_classlookup": """
+        class MyElement(etree.ElementBase):
+            def hello(self) -> str:
+                return str(self.tag)
+
+        def use_classlookup() -> None:
+            lookup = etree.ElementDefaultClassLookup(element=MyElement)
+            parser = etree.XMLParser()
+            parser.set_element_class_lookup(lookup)
+            _ = etree.AttributeBasedElementClassLookup("type", {"x": MyElement})
+            _ = etree.ParserBasedElementClassLookup()
+            ns = etree.ElementNamespaceClassLookup()
+            ns.get_namespace("urn:a")["item"] = MyElement
+        """,
+    "etree/_factory_func": """
+        def use_factory() -> etree._Element:
+            root = etree.Element("root", {"a": "b"}, nsmap={"x": "urn:x"})
+            child = etree.SubElement(root, "child", attrib={"c": "d"})
+            child.append(etree.Comment("comment"))
+            child.append(etree.PI("target", "data"))
+            child.append(etree.Entity("nbsp"))
+            child.text = etree.CDATA("data")
+            _ = etree.ElementTree(root)
+            _ = etree.QName("urn:x", "tag").localname
+            return root
+        """,
+    "etree/_cleanup": """
+        def use_cleanup(root: etree._Element) -> None:
+            etree.strip_attributes(root, "id", "class")
+            etree.strip_elements(root, "script", with_tail=False)
+            etree.strip_tags(root, etree.Comment, "span")
+            etree.cleanup_namespaces(root, top_nsmap={"a": "urn:a"})
+        """,
+    "etree/_validators": """
+        def use_validators(
+            root: etree._Element, xsd: Path, rng: Path, dtd: Path, sch: Path
+        ) -> None:
+            schema = etree.XMLSchema(file=xsd)
+            _ = schema.validate(root), schema.error_log.last_error
+            relaxng = etree.RelaxNG(file=rng)
+            _ = relaxng(root)
+            d = etree.DTD(dtd)
+            _ = d.validate(root)
+            for decl in d.iterelements():
+                _ = decl.name
+            _ = Schematron(file=sch).validate(root)
+        """,
+    "etree/_xmlerror": """
+        def use_errorlog(log: etree._ListErrorLog) -> None:
+            for entry in log:
+                _ = entry.line, entry.column, entry.message, entry.level_name
+            _ = log.filter_from_errors()
+            _ = log.filter_types([etree.ErrorTypes.ERR_TAG_NAME_MISMATCH])
+            _ = log.filter_levels(etree.ErrorLevels.ERROR)
+            _ = etree.ErrorDomains.PARSER
+            _ = etree.RelaxNGErrorTypes.RELAXNG_ERR_NOELEM
+        """,
+    "etree/_xslt": """
+        def use_xslt(style: etree._ElementTree, doc: etree._ElementTree) -> str:
+            transform = etree.XSLT(style)
+            result = transform(doc, param=etree.XSLT.strparam("v"))
+            _ = transform.error_log
+            return str(result)
+        """,
+    "etree/_saxparser": """
+        class Counter:
+            def __init__(self) -> None:
+                self.count = 0
+
+            def start(self, tag: str, attrib: dict[str, str], /) -> None:
+                self.count += 1
+
+            def end(self, tag: str, /) -> None: ...
+            def data(self, data: str, /) -> None: ...
+            def comment(self, text: str, /) -> None: ...
+            def pi(self, target: str, data: str, /) -> None: ...
+            def start_ns(self, prefix: str, uri: str, /) -> None: ...
+            def end_ns(self, prefix: str, /) -> None: ...
+            def doctype(
+                self, root_tag: str | None, public_id: str | None, system_id: str | None, /
+            ) -> None: ...
+            def close(self) -> int:
+                return self.count
+
+        def use_target(data: bytes) -> object:
+            parser = etree.XMLParser(target=Counter())
+            _ = etree.TreeBuilder().close()
+            return etree.fromstring(data, parser)
+        """,
+    "html/_element": """
+        def use_html_element(root: HtmlElement) -> None:
+            _ = root.text_content()
+            _ = root.classes
+            root.classes.add("x")
+            _ = root.cssselect("div > p")
+            _ = root.find_class("x")
+            _ = root.get_element_by_id("main", None)
+            _ = root.head, root.body, root.base_url
+            root.drop_tree()
+            root.drop_tag()
+            for el in root.iter("a"):
+                _ = el.label
+        """,
+    "html/_parse": """
+        def use_html_parse(text: str, path: Path) -> None:
+            _ = html.fromstring(text)
+            _ = html.document_fromstring(text)
+            _ = html.fragment_fromstring(text, create_parent="div")
+            _ = html.fragments_fromstring(text)
+            _ = html.parse(path).getroot()
+            _ = html.HTMLParser(remove_comments=True)
+            _ = html.XHTMLParser()
+        """,
+    "html/_form": """
+        def use_forms(doc: HtmlElement) -> None:
+            for form in doc.forms:
+                _ = form.action, form.method, form.form_values()
+                for name in form.inputs.keys():
+                    _ = form.inputs[name]
+                for inp in form.inputs:
+                    _ = inp.name
+                _ = form.fields
+        """,
+    "html/_funcs": """
+        def use_html_funcs(doc: HtmlElement, text: str) -> None:
+            _ = html.tostring(doc, pretty_print=True)
+            _ = html.tostring(doc, encoding="unicode")
+            doc.make_links_absolute("https://example.com/")
+            for el, attr, link, pos in doc.iterlinks():
+                _ = el, attr, link, pos
+            _ = html.make_links_absolute(text, "https://example.com/")
+            doc.rewrite_links(lambda s: s)
+        """,
+    "html/builder": """
+        def use_html_builder() -> HtmlElement:
+            from lxml.html import builder as E
+
+            return E.HTML(E.HEAD(E.TITLE("t")), E.BODY(E.P("p", E.CLASS("x"))))
+        """,
+    "objectify": """
+        def use_objectify(data: bytes) -> None:
+            root = objectify.fromstring(data)
+            _ = root.item
+            _ = root.countchildren()
+            _ = root["item"]
+            e = objectify.ElementMaker(annotate=False)
+            _ = e.root(e.child("x"))
+            _ = objectify.DataElement(1)
+            _ = objectify.DataElement("x", _pytype="str")
+            objectify.annotate(root)
+            objectify.deannotate(root, cleanup_namespaces=True)
+        """,
+    "builder": """
+        def use_builder() -> etree._Element:
+            E = builder.ElementMaker(namespace="urn:x", nsmap={None: "urn:x"})
+            return E.root(E.child("text", {"a": "b"}), E.other())
+        """,
+    "cssselect": """
+        def use_cssselect(root: etree._Element, doc: HtmlElement) -> None:
+            sel = CSSSelector("div.content > p")
+            _ = sel(root)
+            _ = sel(doc)
+            _ = sel.css, sel.path
+            _ = root.cssselect("a[href]")
+        """,
+    # Not a stub module; stresses keyword argument binding of parser
+    # constructor overloads, as found in code creating many parsers
+    "parser_options": """
+        def use_parser_options(path: Path) -> None:
+            xp = etree.XMLParser(
+                remove_blank_text=True,
+                resolve_entities=False,
+                huge_tree=True,
+                no_network=False,
+                recover=True,
+            )
+            hp = etree.HTMLParser(
+                remove_comments=True, recover=False, default_doctype=False
+            )
+            pp = etree.XMLPullParser(
+                ("start", "end"), tag="x", remove_pis=True, collect_ids=False
+            )
+            hpp = etree.HTMLPullParser(("start",), no_network=True, compact=False)
+            for ev1, el1 in etree.iterparse(
+                path, ("start", "end"), tag="item", huge_tree=True, recover=True
+            ):
+                _ = ev1, el1
+            for item in etree.iterparse(
+                path, ("start-ns", "end-ns"), load_dtd=True, dtd_validation=False
+            ):
+                _ = item
+            for ev2, el2 in etree.iterparse(
+                path, html=True, remove_comments=True, encoding="utf-8"
+            ):
+                _ = ev2, el2
+            for ev3, el3 in etree.iterparse(path, strip_cdata=False, collect_ids=False):
+                _ = ev3, el3
+            _ = xp, hp, pp, hpp
+        """,
+}
+
+# SNIPPETS keys which do not correspond to single stub files.
+# Used only when describing corpus slices in reports.
+ALIASES: dict[str, str] = {
+    "etree/_validators": "etree/_xmlschema + _relaxng + _dtd + isoschematron",
+    "objectify": "objectify/*",
+    "parser_options": "(parser and iterparse keyword arguments)",
+}
+
+
+def _render(snippet: str | None) -> str:
+    if snippet is None:
+        return HEADER
+    return HEADER + "\n" + textwrap.dedent(snippet)
+
+
+def write_corpus(
+    dest: Path,
+    modules: Iterable[str] | None,
+    copies: int,
+) -> list[Path]:
+    """Write corpus files into `dest`
+
+    If `modules` is None, only the common import header is written, which
+    serves as the baseline measurement. Each module snippet is duplicated
+    `copies` times so that the call site cost dominates checker startup.
+    """
+    dest.mkdir(parents=True, exist_ok=True)
+    written: list[Path] = []
+    slices: list[tuple[str, str | None]]
+    if modules is None:
+        slices = [("baseline", None)]
+    else:
+        slices = [(m, SNIPPETS[m]) for m in modules]
+    for name, snippet in slices:
+        content = _render(snippet)
+        stem = name.replace("/", "_").lstrip("_")
+        for i in range(copies):
+            path = dest / "{}_{:03d}.py".format(stem, i)
+            path.write_text(content, encoding="utf-8")
+            written.append(path)
+    return written
@@ -0,0 +1,111 @@
+"""Check which modules type checkers load for a minimal etree program.
+
+Cold start time of type checkers is dominated by the amount of
+annotations transitively imported. Using nothing but `lxml.etree`
+must not drag in annotations of optional third party packages,
+or `lxml` submodules built upon them.
+
+`ty` resolves modules lazily and offers no way to list them,
+so it is not covered here.
+"""
+
+from __future__ import annotations
+
+import csv
+import re
+import subprocess
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+from checkers import CHECKERS, STUB_ROOT
+
+PROGRAM = """\
+from lxml import etree
+etree.fromstring(b"<a/>")
+"""
+
+FORBIDDEN = (
+    "bs4",
+    "cssselect",
+    "html5lib",
+    "lxml.cssselect",
+    "lxml.html.html5parser",
+    "lxml.html.soupparser",
+)
+
+_MYPY_PARSING_RE = re.compile(r"^LOG:  Parsing \S+ \(([\w.]+)\)$", re.MULTILINE)
+
+
+def _path_to_module(path: Path) -> str:
+    if path.is_relative_to(STUB_ROOT):
+        parts = list(path.relative_to(STUB_ROOT).with_suffix("").parts)
+    else:
+        for anchor in ("site-packages", "stdlib"):
+            if anchor in path.parts:
+                idx = len(path.parts) - path.parts[::-1].index(anchor)
+                parts = list(path.with_suffix("").parts[idx:])
+                break
+        else:
+            return path.stem
+    parts[0] = parts[0].removesuffix("-stubs")
+    if parts[-1] == "__init__":
+        parts.pop()
+    return ".".join(parts)
+
+
+def _mypy_modules(corpus_dir: Path, output: str) -> set[str]:
+    return set(_MYPY_PARSING_RE.findall(output))
+
+
+def _pyright_modules(corpus_dir: Path, output: str) -> set[str]:
+    # Dependency report lists each tracked file at line start
+    return {
+        _path_to_module((corpus_dir / line).resolve())
+        for line in output.splitlines()
+        if line.endswith((".py", ".pyi")) and not line[0].isspace()
+    }
+
+
+def _pyrefly_modules(corpus_dir: Path, output: str) -> set[str]:
+    with open(corpus_dir / "bindings.csv", newline="", encoding="utf-8") as f:
+        return {row["Module"] for row in csv.DictReader(f)}
+
+
+# Extra arguments making each checker report modules loaded,
+# and function collecting module names from the report
+_REPORTERS: dict[str, tuple[list[str], Callable[[Path, str], set[str]]]] = {
+    "mypy": (["--verbose"], _mypy_modules),
+    "pyright": (["--verbose", "--dependencies"], _pyright_modules),
+    "basedpyright": (["--verbose", "--dependencies"], _pyright_modules),
+    "pyrefly": (["--report-binding-memory", "bindings.csv"], _pyrefly_modules),
+}
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("name", sorted(_REPORTERS))
+def test_minimal_etree_program(tmp_path: Path, name: str) -> None:
+    checker = CHECKERS[name]
+    if not checker.is_available():
+        pytest.skip("{} is not installed".format(name))
+    extra_args, collect = _REPORTERS[name]
+
+    corpus_dir = tmp_path / "corpus"
+    corpus_dir.mkdir()
+    (corpus_dir / "prog.py").write_text(PROGRAM, encoding="utf-8")
+    checker.configure(corpus_dir, STUB_ROOT)
+    proc = subprocess.run(
+        checker.command(corpus_dir) + extra_args,
+        cwd=corpus_dir,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    assert proc.returncode == 0, proc.stdout
+
+    modules = collect(corpus_dir, proc.stdout)
+    assert "lxml.etree" in modules
+    loaded = sorted(
+        m for m in modules if any(m == f or m.startswith(f + ".") for f in FORBIDDEN)
+    )
+    assert not loaded
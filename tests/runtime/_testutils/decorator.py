@@ -24,6 +24,101 @@ def is_cython_class_method(func: Callable[..., Any]) -> bool:
     return isclass(glob[parent])
 
 
+# Signature check results of (func_to_check, expect_param) pairs;
+# None if check passed, or the error raised otherwise. Tests using
+# hypothesis invoke the wrapped function hundreds of times, while
+# introspecting cython functions is not cheap.
+_checked: dict[
+    tuple[Callable[..., Any], tuple[tuple[str, _ParameterKind, Any] | None, ...]],
+    FuncSignatureError | None,
+] = {}
+
+
+def _check_signature(
+    func_to_check: Callable[..., Any],
+    expect_param: Sequence[tuple[str, _ParameterKind, Any] | None],
+) -> None:
+    sig = signature(func_to_check)
+    param = list(sig.parameters.values())
+    funcname = func_to_check.__qualname__  # ty: ignore[unresolved-attribute]
+
+    has_self = False
+    if param[0].name == "self":
+        has_self = True
+        _ = param.pop(0)
+
+    if len(param) != len(expect_param):
+        raise FuncSignatureError(
+            "Parameter count{}don't match, expected {} but got {}".format(
+                " (excluding Self) " if has_self else " ",
+                len(expect_param),
+                len(param),
+            ),
+            funcname,
+        )
+
+    # For lxml < 5, args in class methods never contain
+    # default values (.__defaults__ property is empty).
+    # This is probably due to older cython
+    # compiler which doesn't support that yet
+    no_default = False
+    if LXML_VERSION < (5, 0) and is_cython_class_method(func_to_check):
+        no_default = True
+
+    for i in range(len(expect_param)):
+        if (p := expect_param[i]) is None:
+            continue
+        if param[i].name != p[0]:
+            raise FuncSignatureError(
+                "Name of parameter {} don't match, expected {} but got {}".format(
+                    i + 1, p[0], param[i].name
+                ),
+                funcname,
+            )
+        if param[i].kind != p[1]:
+            raise FuncSignatureError(
+                "Type of '{}' parameter don't match, expected {} but got {}".format(
+                    p[0], p[1].name, param[i].kind.name
+                ),
+                funcname,
+            )
+        def_val = Parameter.empty if no_default else p[2]
+        if param[i].default != def_val:
+            raise FuncSignatureError(
+                "Default value of '{}' parameter don't match, "
+                "expected {} but got {}".format(
+                    p[0],
+                    "no default" if def_val is Parameter.empty else def_val,
+                    "no default"
+                    if param[i].default is Parameter.empty
+                    else param[i].default,
+                ),
+                funcname,
+            )
+
+
+def _check_signature_once(
+    func_to_check: Callable[..., Any],
+    expect_param: Sequence[tuple[str, _ParameterKind, Any] | None],
+) -> None:
+    key = (func_to_check, tuple(expect_param))
+    try:
+        error = _checked[key]
+    except KeyError:
+        try:
+            _check_signature(func_to_check, expect_param)
+        except FuncSignatureError as e:
+            error = e
+        else:
+            error = None
+        _checked[key] = error
+    except TypeError:  # unhashable default value
+        _check_signature(func_to_check, expect_param)
+        return
+    if error is not None:
+        raise error.with_traceback(None)
+
+
 def signature_tester(
     func_to_check: Callable[..., Any],
     expect_param: Sequence[tuple[str, _ParameterKind, Any] | None],
@@ -31,63 +126,7 @@ def signature_tester(
     def decorator(f: Callable[_P, None]) -> Callable[_P, None]:
         @functools.wraps(f)
         def wrapped(*args: _P.args, **kw: _P.kwargs) -> None:
-            sig = signature(func_to_check)
-            param = list(sig.parameters.values())
-            funcname = func_to_check.__qualname__  # ty: ignore[unresolved-attribute]
-
-            has_self = False
-            if param[0].name == "self":
-                has_self = True
-                _ = param.pop(0)
-
-            if len(param) != len(expect_param):
-                raise FuncSignatureError(
-                    "Parameter count{}don't match, expected {} but got {}".format(
-                        " (excluding Self) " if has_self else " ",
-                        len(expect_param),
-                        len(param),
-                    ),
-                    funcname,
-                )
-
-            # For lxml < 5, args in class methods never contain
-            # default values (.__defaults__ property is empty).
-            # This is probably due to older cython
-            # compiler which doesn't support that yet
-            no_default = False
-            if LXML_VERSION < (5, 0) and is_cython_class_method(func_to_check):
-                no_default = True
-
-            for i in range(len(expect_param)):
-                if (p := expect_param[i]) is None:
-                    continue
-                if param[i].name != p[0]:
-                    raise FuncSignatureError(
-                        "Name of parameter {} don't match, "
-                        "expected {} but got {}".format(i + 1, p[0], param[i].name),
-                        funcname,
-                    )
-                if param[i].kind != p[1]:
-                    raise FuncSignatureError(
-                        "Type of '{}' parameter don't match, "
-                        "expected {} but got {}".format(
-                            p[0], p[1].name, param[i].kind.name
-                        ),
-                        funcname,
-                    )
-                def_val = Parameter.empty if no_default else p[2]
-                if param[i].default != def_val:
-                    raise FuncSignatureError(
-                        "Default value of '{}' parameter don't match, "
-                        "expected {} but got {}".format(
-                            p[0],
-                            "no default" if def_val is Parameter.empty else def_val,
-                            "no default"
-                            if param[i].default is Parameter.empty
-                            else param[i].default,
-                        ),
-                        funcname,
-                    )
+            _check_signature_once(func_to_check, expect_param)
             f(*args, **kw)
 
         return wrapped
@@ -92,3 +92,7 @@ raise_non_callable = pytest.raises(TypeError, match="object is not callable")
 raise_unexpected_type = pytest.raises(
     TypeError, match=r"expected [^,]+, (got \S+|\S+ found)"
 )
+
+# parser.pxi _FeedParser.feed()
+# TypeError("Parsing requires string data")
+raise_non_string_data = pytest.raises(TypeError, match=r"Parsing requires string data")
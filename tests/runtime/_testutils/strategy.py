@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import abc
+import functools
 import inspect
 import operator
 from collections import deque
@@ -17,37 +19,85 @@ from lxml.html.builder import DIV
 _T = TypeVar("_T")
 
 
+# HACK The everything_except() receipe in hypothesis explicitly says
+# it excludes instances of types added via register_type_strategy().
+# That forces one to peek into internal lookup table instead, along
+# with the mess that followed without from_type(type)
+#
+# Candidate types are computed only once per exclusion set; lookup
+# table size is part of cache key, so that types registered later
+# are picked up.
+@functools.cache
+def _type_pool(
+    excluded: tuple[type[Any], ...], exact: bool, _registered: int
+) -> tuple[type, ...]:
+    all_types = st_types._global_type_lookup.keys()
+    if exact:
+        return tuple(t for t in all_types if t not in excluded)
+    return tuple(
+        t for t in all_types if inspect.isclass(t) and not issubclass(t, excluded)
+    )
+
+
+def _may_produce_excluded(typ_: type, excluded: tuple[type[Any], ...]) -> bool:
+    # Hypothesis strategies of abstract classes and protocols produce
+    # assorted concrete objects, which may match excluded types without
+    # any class relationship, e.g. str for SupportsFloat, BytesIO for
+    # BinaryIO, or bytes from ByteString matching Buffer protocol
+    if (
+        isinstance(typ_, abc.ABCMeta)
+        or typ_.__module__ == "typing"
+        or getattr(typ_, "_is_protocol", False)
+    ):
+        return True
+    # Instances of concrete types can only be excluded ones
+    # if typ_ is a base class of any excluded type
+    try:
+        return any(issubclass(e, typ_) for e in excluded)
+    except TypeError:
+        return True
+
+
+@functools.cache
+def _instance_pool(
+    excluded: tuple[type[Any], ...], _registered: int
+) -> tuple[tuple[type, st.SearchStrategy[Any]], ...]:
+    result: list[tuple[type, st.SearchStrategy[Any]]] = []
+    for typ_ in _type_pool(excluded, False, _registered):
+        # HACK from_type() handles TypeVar as a special case, but we don't
+        # have the luxury. Interactive use creates mostly str, bytes, int
+        # and float, and can even raise inside tests. Disallow explicitly
+        # as a workaround.
+        if not st_types.is_a_type(typ_) or typ_.__qualname__ == "TypeVar":
+            continue
+        strategy = cast(st.SearchStrategy[Any], st.from_type(typ_))  # type: ignore[redundant-cast]
+        # Concrete types unrelated to excluded ones never produce
+        # excluded instances, so their draws are never discarded
+        if _may_produce_excluded(typ_, excluded):
+            strategy = strategy.filter(lambda x: not isinstance(x, excluded))
+        result.append((typ_, strategy))
+    return tuple(result)
+
+
 def all_types_except(
     *excluded: type[Any], exact: bool = False
 ) -> st.SearchStrategy[type]:
     if Any in excluded or object in excluded:
         raise ValueError("Cannot exclude everything")
-    # HACK The everything_except() receipe in hypothesis explicitly says
-    # it excludes instances of types added via register_type_strategy().
-    # That forces one to peek into internal lookup table instead, along
-    # with the mess that followed without from_type(type)
-    all_types = st_types._global_type_lookup.keys()
-    if exact:
-        strategy = st.sampled_from([t for t in all_types if t not in excluded])
-    else:
-        strategy = st.sampled_from([
-            t for t in all_types if inspect.isclass(t) and not issubclass(t, excluded)
-        ])
-    return cast(st.SearchStrategy[type], strategy)
+    pool = _type_pool(excluded, exact, len(st_types._global_type_lookup))
+    return st.sampled_from(pool)
 
 
 def all_instances_except_of_type(*excluded: type[Any]) -> st.SearchStrategy[Any]:
-    def _aux_filter(typ_: Any) -> bool:
-        note(f"Failed type: {typ_.__qualname__=} {typ_.__module__=}")
-        # HACK from_type() handles TypeVar as a special case, but we don't have
-        # the luxury. Interactive use creates mostly str, bytes, int and float,
-        # and can even raise inside tests. Disallow explicitly as a workaround.
-        return st_types.is_a_type(typ_) and typ_.__qualname__ not in {"TypeVar"}
-
-    return cast(  # type: ignore[redundant-cast]
-        st.SearchStrategy[Any],
-        all_types_except(*excluded).filter(_aux_filter).flatmap(st.from_type),
-    ).filter(lambda x: not isinstance(x, excluded))
+    if Any in excluded or object in excluded:
+        raise ValueError("Cannot exclude everything")
+
+    def _from_pool(item: tuple[type, st.SearchStrategy[Any]]) -> st.SearchStrategy[Any]:
+        note(f"Failed type: {item[0].__qualname__=} {item[0].__module__=}")
+        return item[1]
+
+    pool = _instance_pool(excluded, len(st_types._global_type_lookup))
+    return st.sampled_from(pool).flatmap(_from_pool)
 
 
 def fixed_item_iterables() -> st.SearchStrategy[Callable[..., Iterable[Any]]]:
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
 import bz2
+import copy
 import functools
 import gzip
+import hashlib
 import io
 import logging
 import lzma
+import mmap
+import os
+import shutil
+import stat
+import tempfile
 from collections.abc import (
     Callable,
     Collection,
@@ -35,10 +42,10 @@ pytest_plugins = [
     "hypothesis",
     "pytest-revealtype-injector",
     "runtime.register_strategy",
+    "runtime.memory_check",
+    "runtime.reveal_cache",
 ]
 
-http_pool = urllib3.PoolManager()
-
 _logger = logging.getLogger(__name__)
 _logger.setLevel(logging.DEBUG)
 
@@ -46,17 +53,66 @@ _logger.setLevel(logging.DEBUG)
 typeguard.config.forward_ref_policy = typeguard.ForwardRefPolicy.ERROR
 typeguard.config.collection_check_strategy = typeguard.CollectionCheckStrategy.ALL_ITEMS
 
+_bightml_key = pytest.StashKey[Path]()
+
 
 def _bightml_filepath() -> Path:
     return Path(__file__).resolve().parent / "_data" / "sample.html.xz"
 
 
+def _shared_data_dir(config: pytest.Config) -> Path:
+    # Must resolve to the same place in all pytest-xdist workers
+    if config.pluginmanager.hasplugin("cacheprovider"):
+        return config.cache.mkdir("data")
+    return Path(tempfile.gettempdir())
+
+
+# The big HTML sample is decompressed only once, into a read-only file
+# shared by all test sessions and pytest-xdist workers. Configuration
+# of xdist controller happens before workers are spawned, so workers
+# would find the file already in place.
+def pytest_configure(config: pytest.Config) -> None:
+    src = _bightml_filepath()
+    digest = hashlib.sha256(src.read_bytes()).hexdigest()[:16]
+    dest = _shared_data_dir(config) / "sample-{}.html".format(digest)
+    if not dest.exists():
+        tmp = dest.with_name("{}.{}.tmp".format(dest.name, os.getpid()))
+        with lzma.open(src, "rb") as fin, tmp.open("wb") as fout:
+            shutil.copyfileobj(fin, fout)
+        tmp.chmod(stat.S_IREAD)
+        tmp.replace(dest)
+    config.stash[_bightml_key] = dest
+
+
+@pytest.fixture(scope="session")
+def http_pool() -> Iterator[urllib3.PoolManager]:
+    pool = urllib3.PoolManager()
+    yield pool
+    pool.clear()
+
+
+@pytest.fixture(scope="session")
+def bightml_filepath(pytestconfig: pytest.Config) -> Path:
+    """Decompressed big HTML sample"""
+    return pytestconfig.stash[_bightml_key]
+
+
+# Memory map of decompressed big HTML sample, which is shared
+# between pytest-xdist workers by OS page cache
+@pytest.fixture(scope="session")
+def bightml_mmap(bightml_filepath: Path) -> Iterator[mmap.mmap]:
+    with bightml_filepath.open("rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    with mm:
+        yield mm
+
+
 # To fool test functions that use this fixture,
 # specify argument type as typing.BinaryIO
 # and don't include Iterator/Generator
 @pytest.fixture
-def bightml_bin_fp() -> Iterator[lzma.LZMAFile]:
-    fp = lzma.open(_bightml_filepath(), "rb")
+def bightml_bin_fp(bightml_filepath: Path) -> Iterator[BinaryIO]:
+    fp = bightml_filepath.open("rb")
     yield fp
     if not fp.closed:
         fp.close()
@@ -66,25 +122,21 @@ def bightml_bin_fp() -> Iterator[lzma.LZMAFile]:
 # specify argument type as typing.TextIO
 # and don't include Iterator/Generator
 @pytest.fixture
-def bightml_txt_fp() -> Iterator[TextIO]:
-    fp = lzma.open(_bightml_filepath(), "rt", encoding="utf-8")
+def bightml_txt_fp(bightml_filepath: Path) -> Iterator[TextIO]:
+    fp = bightml_filepath.open("rt", encoding="utf-8")
     yield fp
     if not fp.closed:
         fp.close()
 
 
 @pytest.fixture(scope="session")
-def bightml_str() -> str:
-    with lzma.open(_bightml_filepath(), "rt", encoding="utf-8") as f:
-        result = f.read()
-    return result
+def bightml_str(bightml_mmap: mmap.mmap) -> str:
+    return bightml_mmap[:].decode("utf-8")
 
 
 @pytest.fixture(scope="session")
-def bightml_bytes() -> bytes:
-    with lzma.open(_bightml_filepath(), "rb") as f:
-        result = f.read()
-    return result
+def bightml_bytes(bightml_mmap: mmap.mmap) -> bytes:
+    return bightml_mmap[:]
 
 
 @pytest.fixture(scope="session")
@@ -143,11 +195,28 @@ def xml2_bytes(xml2_filepath: Path) -> bytes:
     return xml2_filepath.read_bytes()
 
 
+# Big HTML sample is parsed only once per session. Tests must not
+# modify the shared tree; those which do should request bightml_tree
+# or bightml_root instead, which get a private deep copy.
+@pytest.fixture(scope="session")
+def bightml_shared_tree(bightml_filepath: Path) -> _e._ElementTree[_h.HtmlElement]:
+    return _h.parse(bightml_filepath)
+
+
+@pytest.fixture(scope="session")
+def bightml_shared_root(
+    bightml_shared_tree: _e._ElementTree[_h.HtmlElement],
+) -> _h.HtmlElement:
+    return bightml_shared_tree.getroot()
+
+
+# Copying a parsed tree is several times faster than parsing again,
+# and keeps element classes and docinfo of the original
 @pytest.fixture
-def bightml_tree(bightml_bin_fp: BinaryIO) -> _e._ElementTree[_h.HtmlElement]:
-    with bightml_bin_fp as f:
-        tree = _h.parse(f)
-    return tree
+def bightml_tree(
+    bightml_shared_tree: _e._ElementTree[_h.HtmlElement],
+) -> _e._ElementTree[_h.HtmlElement]:
+    return copy.deepcopy(bightml_shared_tree)
 
 
 @pytest.fixture
@@ -349,6 +418,7 @@ def _get_compressed_fp_from(zmode: str) -> Any:
 def generate_input_file_arguments(
     pytestconfig: pytest.Config,
     pook: Any,
+    http_pool: urllib3.PoolManager,
 ) -> Callable[..., Iterator[Any]]:
     def _wrapped(
         path: Path,
@@ -12,7 +12,12 @@ from lxml.etree import (
     _Element as _Element,
     _ElementTree as _ElementTree,
 )
-from lxml.objectify import ObjectifiedElement, ObjectifyElementClassLookup
+from lxml.html import HtmlElement as HtmlElement, XHTMLParser
+from lxml.objectify import (
+    ObjectifiedElement,
+    ObjectifyElementClassLookup,
+    makeparser,
+)
 from typeguard import TypeCheckError
 
 from .._testutils import is_multi_subclass_build
@@ -36,6 +41,20 @@ def test_manual_objectify_parser(xml2_filepath: pathlib.Path) -> None:
     reveal_type(tree.getroot())
 
 
+@pytest.mark.parametrize("use_objectify", [True, False])
+def test_union_of_parsers(xml2_filepath: pathlib.Path, use_objectify: bool) -> None:
+    parser: XMLParser[ObjectifiedElement] | XHTMLParser
+    if use_objectify:
+        parser = makeparser()
+    else:
+        parser = XHTMLParser()
+    reveal_type(_e.fromstring(xml2_filepath.read_bytes(), parser))
+    reveal_type(_e.XML(xml2_filepath.read_bytes(), parser=parser))
+    tree = _e.parse(xml2_filepath, parser)
+    reveal_type(tree)
+    reveal_type(tree.getroot())
+
+
 class TestDefaultLookup:
     def test_single_subclass(self, xml2_filepath: pathlib.Path) -> None:
         class MyBaseElement(ElementBase):
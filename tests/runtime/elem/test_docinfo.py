@@ -12,6 +12,7 @@ from typing import (
 
 import pook  # pyright: ignore[reportMissingTypeStubs]
 import pytest
+import urllib3
 from hypothesis import given, settings
 from lxml.etree import (
     DTD as DTD,
@@ -28,7 +29,6 @@ from .._testutils.errors import (
     raise_invalid_utf8_type,
     raise_unexpected_type,
 )
-from ..conftest import http_pool
 
 if sys.version_info >= (3, 11):
     from typing import reveal_type
@@ -72,7 +72,9 @@ class TestSource:
         reveal_type(docinfo.system_url)
         reveal_type(docinfo.URL)
 
-    def test_from_remote_url(self, xml2_bytes_with_dtd: bytes) -> None:
+    def test_from_remote_url(
+        self, xml2_bytes_with_dtd: bytes, http_pool: urllib3.PoolManager
+    ) -> None:
         with pook.get(  # pyright: ignore[reportUnknownMemberType]
             "https://example.com/test.xml",
             reply=200,
@@ -14,7 +14,10 @@ from lxml import etree
 from lxml.etree import (
     LXML_VERSION,
     QName,
+    _Comment as _Comment,
     _Element,
+    _Entity as _Entity,
+    _ProcessingInstruction as _ProcessingInstruction,
     iselement,
 )
 
@@ -69,6 +72,20 @@ class TestIter:
         else:
             assert len(result) > 0
 
+    def test_special_node_factory(self, disposable_element: _Element) -> None:
+        disposable_element.append(etree.Comment("comment"))
+        disposable_element.append(etree.PI("target", "data"))
+        disposable_element.append(etree.Entity("amp"))
+        comments = reveal_type(list(disposable_element.iter(etree.Comment)))
+        assert len(comments) == 1
+        pis = reveal_type(list(disposable_element.iter(tag=etree.PI)))
+        assert len(pis) == 1
+        entities = reveal_type(list(disposable_element.iter(etree.Entity)))
+        assert len(entities) == 1
+        # Mixing factories with other selectors falls back to _Element
+        mixed = reveal_type(disposable_element.iter(etree.Comment, etree.PI))
+        assert len(list(mixed)) == 2
+
     @settings(
         suppress_health_check=[
             HealthCheck.too_slow,
@@ -150,6 +167,20 @@ class TestIterDescendants:
         else:
             assert len(result) > 0
 
+    def test_special_node_factory(self, disposable_element: _Element) -> None:
+        disposable_element.append(etree.Comment("comment"))
+        disposable_element.append(etree.PI("target", "data"))
+        disposable_element.append(etree.Entity("amp"))
+        comments = reveal_type(list(disposable_element.iterdescendants(etree.Comment)))
+        assert len(comments) == 1
+        pis = reveal_type(list(disposable_element.iterdescendants(tag=etree.PI)))
+        assert len(pis) == 1
+        entities = reveal_type(list(disposable_element.iterdescendants(etree.Entity)))
+        assert len(entities) == 1
+        # Mixing factories with other selectors falls back to _Element
+        mixed = reveal_type(disposable_element.iterdescendants(etree.Comment, etree.PI))
+        assert len(list(mixed)) == 2
+
     @settings(
         suppress_health_check=[
             HealthCheck.too_slow,
@@ -315,6 +346,15 @@ class TestIterSiblings:
         else:
             assert len(result) > 0
 
+    def test_special_node_factory(self, disposable_element: _Element) -> None:
+        first = etree.SubElement(disposable_element, "first")
+        disposable_element.append(etree.Comment("comment"))
+        disposable_element.append(etree.PI("target", "data"))
+        comments = reveal_type(list(first.itersiblings(etree.Comment)))
+        assert len(comments) == 1
+        pis = reveal_type(list(first.itersiblings(tag=etree.PI)))
+        assert len(pis) == 1
+
     @settings(
         suppress_health_check=[
             HealthCheck.too_slow,
@@ -401,6 +441,15 @@ class TestIterChildren:
         else:
             assert len(result) > 0
 
+    def test_special_node_factory(self, disposable_element: _Element) -> None:
+        disposable_element.append(etree.Comment("comment"))
+        disposable_element.append(etree.Entity("amp"))
+        comments = reveal_type(list(disposable_element.iterchildren(etree.Comment)))
+        assert len(comments) == 1
+        itr = disposable_element.iterchildren(etree.Entity, reversed=True)
+        entities = reveal_type(list(itr))
+        assert len(entities) == 1
+
     @settings(
         suppress_health_check=[
             HealthCheck.too_slow,
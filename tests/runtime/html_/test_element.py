@@ -22,6 +22,7 @@ from hypothesis import (
     settings,
     strategies as st,
 )
+from lxml import etree
 from lxml.etree import (
     LXML_VERSION,
     _Element,
@@ -36,6 +37,7 @@ from lxml.html import (
     HtmlProcessingInstruction,
     InputElement,
     LabelElement,
+    fragment_fromstring,
 )
 
 from .._testutils import strategy as _st
@@ -67,16 +69,16 @@ if TYPE_CHECKING:
 class TestMixinProperties:
     def test_property_ro_1(
         self,
-        bightml_root: HtmlElement,
+        bightml_shared_root: HtmlElement,
     ) -> None:
-        reveal_type(bightml_root.head)
-        reveal_type(bightml_root.body)
-        reveal_type(bightml_root.forms)
-        reveal_type(bightml_root.base_url)
+        reveal_type(bightml_shared_root.head)
+        reveal_type(bightml_shared_root.body)
+        reveal_type(bightml_shared_root.forms)
+        reveal_type(bightml_shared_root.base_url)
 
         for a in ["head", "body", "forms", "base_url"]:
             with raise_prop_not_writable:
-                setattr(bightml_root, a, getattr(bightml_root, a))
+                setattr(bightml_shared_root, a, getattr(bightml_shared_root, a))
 
     def test_property_ro_2(self) -> None:
         el = Element("div")
@@ -191,42 +193,42 @@ class TestBasicBehavior:
         with raise_non_integer:
             _ = cast(Any, disposable_html_element[thing])
 
-    def test_sequence_read_ok(self, bightml_root: HtmlElement) -> None:
-        reveal_type(len(bightml_root))
-        length = len(bightml_root)
-        reveal_type(bightml_root[randrange(length)])
-        reveal_type(bightml_root[: 2])  # fmt: skip  # ast: why the space???
+    def test_sequence_read_ok(self, bightml_shared_root: HtmlElement) -> None:
+        reveal_type(len(bightml_shared_root))
+        length = len(bightml_shared_root)
+        reveal_type(bightml_shared_root[randrange(length)])
+        reveal_type(bightml_shared_root[: 2])  # fmt: skip  # ast: why the space???
 
-        itr = iter(bightml_root)
+        itr = iter(bightml_shared_root)
         reveal_type(itr)
         item = next(itr)
         reveal_type(item)
-        assert bightml_root.index(item) == 0
+        assert bightml_shared_root.index(item) == 0
         del itr
 
-        for sub in bightml_root:
+        for sub in bightml_shared_root:
             reveal_type(sub)
 
-        assert bightml_root.body is not None
-        subelem = bightml_root.body[3]
-        reveal_type(subelem in bightml_root)
+        assert bightml_shared_root.body is not None
+        subelem = bightml_shared_root.body[3]
+        reveal_type(subelem in bightml_shared_root)
         o = object()
-        reveal_type(o in bightml_root)
+        reveal_type(o in bightml_shared_root)
 
         with raise_non_integer:
-            _ = bightml_root[cast(int, "0")]
+            _ = bightml_shared_root[cast(int, "0")]
 
     # mypy and ty don't support magic method and always treat
     # reversed(...) as `reversed` object
     @pytest.mark.notypechecker("mypy", "ty")
-    def test_reversed_seq_read_1(self, bightml_root: HtmlElement) -> None:
-        rev = reversed(bightml_root)
+    def test_reversed_seq_read_1(self, bightml_shared_root: HtmlElement) -> None:
+        rev = reversed(bightml_shared_root)
         reveal_type(rev)
         reveal_type(list(rev))
 
     @pytest.mark.onlytypechecker("mypy", "ty")
-    def test_reversed_seq_read_2(self, bightml_root: HtmlElement) -> None:
-        rev = bightml_root.__reversed__()
+    def test_reversed_seq_read_2(self, bightml_shared_root: HtmlElement) -> None:
+        rev = bightml_shared_root.__reversed__()
         reveal_type(rev)
         reveal_type(list(rev))
 
@@ -256,6 +258,24 @@ class TestBasicBehavior:
         del disposable_html_element[0:2]
         assert len(disposable_html_element) == length - 2
 
+    # Only mypy plugin narrows special nodes; otherwise they are
+    # typed as HtmlElement, which HtmlComment etc don't inherit at runtime
+    @pytest.mark.onlytypechecker("mypy")
+    def test_iter_special_node_factory(self) -> None:
+        div = fragment_fromstring("<div><!--comment--></div>")
+        # HTML parser turns processing instructions into comments and
+        # resolves entities, so keep references to created nodes instead,
+        # otherwise their proxies are recreated as generic etree nodes
+        pi = HtmlProcessingInstruction("target", "data")
+        entity = HtmlEntity("amp")
+        div.extend((pi, entity))
+        comments = reveal_type(list(div.iter(etree.Comment)))
+        assert len(comments) == 1
+        pis = reveal_type(list(div.iterdescendants(etree.PI)))
+        assert len(pis) == 1
+        entities = reveal_type(list(div.iter(tag=etree.Entity)))
+        assert len(entities) == 1
+
     @settings(suppress_health_check=[HealthCheck.too_slow], max_examples=300)
     @given(thing=_st.all_instances_except_of_type(_Element))
     @pytest.mark.slow
@@ -113,9 +113,9 @@ class TestInputOutputType:
         self,
         html2_str: str,
         html2_bytes: bytes,
-        bightml_root: HtmlElement,
+        bightml_shared_root: HtmlElement,
     ) -> None:
-        for data in (html2_bytes, html2_str, bightml_root):
+        for data in (html2_bytes, html2_str, bightml_shared_root):
             result = find_rel_links(data, "nofollow noopener noreferrer")
             reveal_type(result)
 
@@ -124,9 +124,9 @@ class TestInputOutputType:
         self,
         html2_str: str,
         html2_bytes: bytes,
-        bightml_root: HtmlElement,
+        bightml_shared_root: HtmlElement,
     ) -> None:
-        for data in (html2_bytes, html2_str, bightml_root):
+        for data in (html2_bytes, html2_str, bightml_shared_root):
             result = find_class(data, "single")
             reveal_type(result)
 
@@ -135,9 +135,9 @@ class TestInputOutputType:
         self,
         html2_str: str,
         html2_bytes: bytes,
-        bightml_root: HtmlElement,
+        bightml_shared_root: HtmlElement,
     ) -> None:
-        for data in (html2_bytes, html2_str, bightml_root):
+        for data in (html2_bytes, html2_str, bightml_shared_root):
             itr = iterlinks(data)
             reveal_type(itr)
             for link in itr:
@@ -152,7 +152,7 @@ class TestInputOutputType:
         self,
         html2_str: str,
         html2_bytes: bytes,
-        bightml_root: HtmlElement,
+        bightml_shared_root: HtmlElement,
     ) -> None:
         # Already beyond the scope of typing. Let it stay nonetheless,
         # in case some idea pops up on how to improve this.
@@ -162,44 +162,44 @@ class TestInputOutputType:
             _ = make_links_absolute(html2_bytes)
         reveal_type(make_links_absolute(html2_str, _BASE_HREF))
         reveal_type(make_links_absolute(html2_bytes, _BASE_HREF))
-        reveal_type(make_links_absolute(bightml_root, _BASE_HREF))
+        reveal_type(make_links_absolute(bightml_shared_root, _BASE_HREF))
 
     @byte_bug_marker
     def test_resolve_base_href(
         self,
         html2_str: str,
         html2_bytes: bytes,
-        bightml_root: HtmlElement,
+        bightml_shared_root: HtmlElement,
     ) -> None:
         reveal_type(resolve_base_href(html2_str))
         reveal_type(resolve_base_href(html2_bytes))
-        reveal_type(resolve_base_href(bightml_root))
+        reveal_type(resolve_base_href(bightml_shared_root))
 
     @byte_bug_marker
     def test_rewrite_links(
         self,
         html2_str: str,
         html2_bytes: bytes,
-        bightml_root: HtmlElement,
+        bightml_shared_root: HtmlElement,
     ) -> None:
         reveal_type(rewrite_links(html2_str, lambda _: _BASE_HREF))
         reveal_type(rewrite_links(html2_bytes, lambda _: _BASE_HREF))
-        reveal_type(rewrite_links(bightml_root, lambda _: _BASE_HREF))
+        reveal_type(rewrite_links(bightml_shared_root, lambda _: _BASE_HREF))
 
 
 class TestFindRelLinksArg:
     # XPath selection result always generate str, never match other
     # string-like types. So bytes and bytearray are banned in stub
     # despite the fact that they don't raise exception
-    def test_wrong_type_no_raise(self, bightml_root: HtmlElement) -> None:
+    def test_wrong_type_no_raise(self, bightml_shared_root: HtmlElement) -> None:
         attributes = "nofollow noopener noreferrer"
-        links = find_rel_links(bightml_root, attributes)
+        links = find_rel_links(bightml_shared_root, attributes)
         assert len(links) > 0
         del links
         b = attributes.encode("utf-8")
-        links = find_rel_links(bightml_root, cast(Any, b))
+        links = find_rel_links(bightml_shared_root, cast(Any, b))
         assert len(links) == 0
-        links = find_rel_links(bightml_root, cast(Any, bytearray(b)))
+        links = find_rel_links(bightml_shared_root, cast(Any, bytearray(b)))
         assert len(links) == 0
 
     @settings(suppress_health_check=[HealthCheck.too_slow], max_examples=300)
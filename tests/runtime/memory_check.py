@@ -0,0 +1,130 @@
+# Check heap memory usage of tests handling the big HTML sample,
+# to verify that the streaming patterns suggested in stub docstrings
+# (iterparse() and clearing processed elements, etc) actually release
+# memory allocated by libxml2.
+#
+# lxml.etree.memory_debugger is of no use here, as it only reports
+# anything when libxml2 is built with memory debugging support, which
+# is never the case for lxml binary wheels. Instead, count bytes in use
+# by C heap allocator, which libxml2 allocates through. Most Python
+# objects live in pymalloc arenas mapped separately from C heap, so
+# only bigger ones (caches filled on first use of typeguard,
+# reveal_type() etc) add noise, which leak threshold allows for.
+# tracemalloc is no help in subtracting them, as its own bookkeeping
+# of each traced object is allocated from C heap too. Process RSS is
+# not suitable either, because freed memory is mostly kept by
+# allocator and reused later, hiding leaks of a few hundred KiB.
+
+from __future__ import annotations
+
+import ctypes
+import gc
+import logging
+import sys
+from collections.abc import Callable, Iterator
+from typing import cast
+
+import pytest
+
+# Fixtures which load sample.html.xz, directly or indirectly
+BIGHTML_FIXTURES = frozenset({
+    "bightml_filepath",
+    "bightml_mmap",
+    "bightml_bin_fp",
+    "bightml_txt_fp",
+    "bightml_str",
+    "bightml_bytes",
+    "bightml_shared_tree",
+    "bightml_shared_root",
+    "bightml_tree",
+    "bightml_root",
+})
+
+_INJECTOR_LOGGER = "revealtype-injector"
+
+
+class _MallInfo2(ctypes.Structure):
+    _fields_ = [
+        (name, ctypes.c_size_t)
+        for name in (
+            "arena",
+            "ordblks",
+            "smblks",
+            "hblks",
+            "hblkhd",
+            "usmblks",
+            "fsmblks",
+            "uordblks",
+            "fordblks",
+            "keepcost",
+        )
+    ]
+
+
+def _heap_usage_func() -> Callable[[], int] | None:
+    # mallinfo2() is available since glibc 2.33; other platforms and
+    # C libraries are left unchecked
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        mallinfo2 = ctypes.CDLL(None).mallinfo2
+    except AttributeError:
+        return None
+    mallinfo2.argtypes = []
+    mallinfo2.restype = _MallInfo2
+
+    def heap_usage() -> int:
+        gc.collect()
+        info: _MallInfo2 = mallinfo2()
+        # bytes in use from main heap, plus separately mmap-ed chunks
+        return int(info.uordblks + info.hblkhd)
+
+    return heap_usage
+
+
+_heap_usage = _heap_usage_func()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--bightml-leak-threshold",
+        type=int,
+        default=1 << 17,
+        metavar="BYTES",
+        help="Maximum growth of C heap usage allowed for tests using "
+        "the big HTML sample; a parsed copy of the sample takes about "
+        "300 KiB (default: %(default)s)",
+    )
+
+
+# Being an autouse function scoped fixture, it is set up after all
+# session scoped fixtures (like bightml_shared_tree, which outlive the
+# first test requesting them). Function scoped fixtures like
+# bightml_tree are only released by pytest after all teardown, so they
+# are set up before measuring, and only memory kept by test itself is
+# counted.
+@pytest.fixture(autouse=True)
+def bightml_heap_check(request: pytest.FixtureRequest) -> Iterator[None]:
+    item = cast(pytest.Item, request.node)  # pyright: ignore[reportUnknownMemberType]
+    names = BIGHTML_FIXTURES.intersection(request.fixturenames)
+    if _heap_usage is None or not names:
+        yield
+        return
+    for name in names:
+        request.getfixturevalue(name)
+    # Captured log of each test phase is kept by pytest until session
+    # ends; debug record of every reveal_type() call, logged by injector
+    # under quiet or very verbose mode, would outweigh any leak
+    caplog = cast(pytest.LogCaptureFixture, request.getfixturevalue("caplog"))
+    logger = logging.getLogger(_INJECTOR_LOGGER)
+    caplog.set_level(max(logger.level, logging.INFO), _INJECTOR_LOGGER)
+    before = _heap_usage()
+    yield
+    growth = _heap_usage() - before
+    item.user_properties.append(("heap_bytes_growth", growth))
+    threshold: int = request.config.getoption("--bightml-leak-threshold")
+    if growth > threshold:
+        pytest.fail(
+            "C heap usage grew by {} bytes, exceeding {}".format(growth, threshold),
+            pytrace=False,
+        )
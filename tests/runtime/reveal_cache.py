@@ -0,0 +1,226 @@
+# Reuse reveal_type() results of type checkers across test sessions.
+#
+# pytest-revealtype-injector runs every enabled type checker over all
+# collected test modules before tests start. Results of a test module
+# only depend on its own content, annotations under test, the checker
+# and its configuration, so they are stored in pytest cache under a
+# hash of all these, and checkers are only run on modules without
+# matching cache entry.
+#
+# Caching works by replacing injector internals, which are no public
+# API; unknown injector versions leave type checkers running as usual.
+
+from __future__ import annotations
+
+import hashlib
+import importlib.metadata
+import json
+import logging
+import os
+import subprocess
+import sys
+from collections import Counter
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+import pytest
+from pytest_revealtype_injector import hooks
+from pytest_revealtype_injector.models import FilePos, TypeCheckerAdapter, VarType
+
+if sys.version_info >= (3, 14):
+    from annotationlib import ForwardRef
+else:
+    from typing import ForwardRef
+
+_logger = logging.getLogger(__name__)
+
+_ROOT = Path(__file__).resolve().parents[2]
+
+# Files other than test module itself affecting revealed types;
+# pyright and basedpyright are configured in pyproject.toml
+_SUPPORT_PATHS = (
+    _ROOT / "pyproject.toml",
+    _ROOT / "src" / "lxml-stubs",
+    _ROOT / "src" / "mypy_plugin_lxml",
+    _ROOT / "tests" / "runtime" / "_testutils",
+    _ROOT / "tests" / "runtime" / "conftest.py",
+)
+
+# Installed packages whose annotations are used by stubs or tests
+_SUPPORT_PACKAGES = (
+    "typing_extensions",
+    "cssselect",
+    "beautifulsoup4",
+    "types-html5lib",
+)
+
+# Injector versions whose internals were verified to work with caching
+_INJECTOR_VERSIONS = ("0.9.",)
+
+_CACHE_DIR = "revealtype"
+
+# Cached entries: (lineno, variable name, revealed type)
+_Entry = tuple[int, "str | None", str]
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--revealtype-no-cache",
+        action="store_true",
+        help="Always run type checkers instead of reusing reveal_type() "
+        "results recorded by previous sessions",
+    )
+
+
+def _hash_tree(paths: Iterable[Path]) -> str:
+    digest = hashlib.sha256()
+    for root in paths:
+        files = [root] if root.is_file() else sorted(root.rglob("*.py*"))
+        for path in files:
+            if path.suffix not in {".py", ".pyi", ".toml"}:
+                continue
+            digest.update(path.relative_to(_ROOT).as_posix().encode())
+            digest.update(b"\0")
+            digest.update(path.read_bytes())
+            digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _package_version(name: str) -> str:
+    try:
+        return importlib.metadata.version(name)
+    except importlib.metadata.PackageNotFoundError:
+        return ""
+
+
+def _support_versions() -> str:
+    return " ".join(
+        "{}={}".format(name, _package_version(name)) for name in _SUPPORT_PACKAGES
+    )
+
+
+def _can_patch(adapter: TypeCheckerAdapter) -> bool:
+    return (
+        callable(getattr(adapter, "run_typechecker_on", None))
+        and isinstance(getattr(adapter, "_executable", None), str)
+        and isinstance(getattr(adapter, "typechecker_result", None), dict)
+    )
+
+
+def _checker_version(adapter: TypeCheckerAdapter) -> str:
+    try:
+        return importlib.metadata.version(adapter.id)
+    except importlib.metadata.PackageNotFoundError:
+        pass
+    proc = subprocess.run(
+        [adapter._executable, "--version"],  # pyright: ignore[reportPrivateUsage]
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return proc.stdout.strip()
+
+
+class _CachingRunner:
+    """Replacement of adapter's `run_typechecker_on()`, which only runs
+    type checker on modules without cached result"""
+
+    def __init__(
+        self, adapter: TypeCheckerAdapter, cache_dir: Path, support_hash: str
+    ) -> None:
+        self._adapter = adapter
+        self._run: Callable[[Iterable[Path]], None] = adapter.run_typechecker_on
+        self._cache_dir = cache_dir
+        digest = hashlib.sha256()
+        for part in (
+            adapter.id,
+            _checker_version(adapter),
+            "{}.{}".format(*sys.version_info[:2]),
+            support_hash,
+        ):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        if adapter.config_file is not None:
+            digest.update(adapter.config_file.read_bytes())
+        self._base_digest = digest
+
+    def _key(self, path: Path) -> str:
+        digest = self._base_digest.copy()
+        digest.update(path.name.encode())
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+        return digest.hexdigest()
+
+    def __call__(self, paths: Iterable[Path]) -> None:
+        paths = list(paths)
+        # Results are keyed by file name only; can't tell apart
+        # modules with the same name, so never cache them
+        names = Counter(p.name for p in paths)
+        result = self._adapter.typechecker_result
+        pending: dict[Path, str | None] = {}
+        for path in paths:
+            if names[path.name] > 1:
+                pending[path] = None
+                continue
+            key = self._key(path)
+            cache_file = self._cache_dir / (key + ".json")
+            try:
+                entries: list[_Entry] = json.loads(cache_file.read_text("utf-8"))
+            except (OSError, ValueError):
+                pending[path] = key
+                continue
+            for lineno, var, type_ in entries:
+                result[FilePos(path.name, lineno)] = VarType(var, ForwardRef(type_))
+
+        _logger.info(
+            "(%s) %d of %d test modules use cached result",
+            self._adapter.id,
+            len(paths) - len(pending),
+            len(paths),
+        )
+        if not pending:
+            return
+        self._run(list(pending))
+
+        for path, key in pending.items():
+            if key is None:
+                continue
+            entries = [
+                (pos.lineno, vt.var, vt.type.__forward_arg__)
+                for pos, vt in result.items()
+                if pos.file == path.name
+            ]
+            # Unique per process, for pytest-xdist workers writing
+            # the same entry concurrently
+            tmp = self._cache_dir / "{}.{}.tmp".format(key, os.getpid())
+            tmp.write_text(json.dumps(entries), "utf-8")
+            tmp.replace(self._cache_dir / (key + ".json"))
+
+
+# Must run after pytest-revealtype-injector has created adapters
+@pytest.hookimpl(trylast=True)
+def pytest_configure(config: pytest.Config) -> None:
+    if config.getoption("--revealtype-no-cache") or not config.pluginmanager.hasplugin(
+        "cacheprovider"
+    ):
+        return
+    injector_version = _package_version("pytest-revealtype-injector")
+    if not injector_version.startswith(_INJECTOR_VERSIONS):
+        _logger.warning(
+            "reveal_type() result caching disabled for pytest-revealtype-injector %s",
+            injector_version,
+        )
+        return
+    cache_dir = config.cache.mkdir(_CACHE_DIR)
+    support_hash = _hash_tree(_SUPPORT_PATHS) + _support_versions()
+    for adapter in config.stash[hooks.adapter_stash_key]:
+        if not _can_patch(adapter):
+            _logger.warning(
+                "(%s) reveal_type() result caching disabled, adapter "
+                "internals have changed",
+                adapter.id,
+            )
+            continue
+        adapter.run_typechecker_on = _CachingRunner(  # type: ignore[method-assign]
+            adapter, cache_dir, support_hash
+        )
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import TYPE_CHECKING, TypeVar
+
+from lxml.etree import HTMLPullParser, XMLPullParser, _Element as _Element
+
+if sys.version_info >= (3, 11):
+    from typing import reveal_type
+else:
+    from typing_extensions import reveal_type
+
+if TYPE_CHECKING:
+    from lxml.etree import AsyncReader, EventPullParser
+
+_T = TypeVar("_T")
+
+
+# Example of an asynchronous loop driving pull parser, annotated
+# with stub-only protocols only
+async def iter_events(
+    source: AsyncReader[bytes],
+    parser: EventPullParser[_T],
+    chunk_size: int = 256,
+) -> AsyncIterator[_T]:
+    while chunk := await source.read(chunk_size):
+        parser.feed(chunk)
+        for event in parser.read_events():
+            yield event
+    parser.close()
+    for event in parser.read_events():
+        yield event
+
+
+def _stream_of(content: bytes) -> asyncio.StreamReader:
+    # Must be created inside running event loop for python < 3.10
+    reader = asyncio.StreamReader()
+    reader.feed_data(content)
+    reader.feed_eof()
+    return reader
+
+
+class TestAsyncFeed:
+    def test_xml_default_event(self, svg_filepath: Path) -> None:
+        async def main() -> int:
+            count = 0
+            parser = XMLPullParser()
+            async for event, elem in iter_events(
+                _stream_of(svg_filepath.read_bytes()), parser
+            ):
+                reveal_type(event)
+                reveal_type(elem)
+                count += 1
+            return count
+
+        assert asyncio.run(main()) > 0
+
+    def test_xml_more_event(self, svg_filepath: Path) -> None:
+        async def main() -> set[str]:
+            names: set[str] = set()
+            parser = XMLPullParser(("start", "end", "start-ns", "end-ns"))
+            async for item in iter_events(
+                _stream_of(svg_filepath.read_bytes()), parser
+            ):
+                names.add(item[0])
+                if item[0] == "start-ns":
+                    reveal_type(item[1])
+            return names
+
+        assert asyncio.run(main()) == {"start", "end", "start-ns", "end-ns"}
+
+    def test_html(self, html2_bytes: bytes) -> None:
+        async def main() -> list[_Element]:
+            parser = HTMLPullParser(("start",), tag="meta")
+            return [
+                elem
+                async for _, elem in iter_events(_stream_of(html2_bytes), parser, 64)
+            ]
+
+        elems = asyncio.run(main())
+        reveal_type(elems)
+        assert elems and all(e.tag == "meta" for e in elems)
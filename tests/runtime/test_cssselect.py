@@ -20,7 +20,14 @@ from lxml.etree import (
     _ListErrorLog as _ListErrorLog,
     parse,
 )
-from lxml.html import HtmlElement
+from lxml.html import (
+    FormElement as FormElement,
+    HtmlElement,
+    InputElement as InputElement,
+    LabelElement as LabelElement,
+    SelectElement as SelectElement,
+    fromstring,
+)
 
 from ._testutils import signature_tester, strategy as _st
 from ._testutils.common import (
@@ -194,6 +201,26 @@ class TestElementMethod:
             selector = CSSSelector(expr, translator="html")
             assert result == selector(html2_root)
 
+    # mypy plugin narrows form related elements from literal selectors
+    def test_html_form_element(self) -> None:
+        root = fromstring(
+            '<form><label for="a">A</label><input id="a" type="text"/>'
+            "<select><option>x</option></select></form>"
+        )
+        reveal_type(root.cssselect("form input[type=text]"))
+        reveal_type(root.cssselect("form"))
+        reveal_type(root.cssselect("label, select"))
+        reveal_type(root.cssselect("form > *"))
+        reveal_type(CSSSelector("form label")(root))
+
+    # list is invariant, so annotation of wider item type must
+    # still be accepted for narrowed results
+    def test_html_form_element_annotated(self) -> None:
+        root = fromstring('<form><input id="a"/><label for="a">A</label></form>')
+        inputs: list[HtmlElement] = root.cssselect("input")
+        labels: list[HtmlElement] = CSSSelector("label")(root)
+        assert len(inputs) == len(labels) == 1
+
 
 class MyElement(ElementBase):
     pass
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import sys
+from typing import Any, cast
+
+import pytest
+from lxml.etree import (
+    LXML_VERSION,
+    HTMLParser,
+    HTMLPullParser,
+    TreeBuilder,
+    XMLParser,
+    XMLPullParser,
+    _Element as _Element,
+    fromstring,
+    fromstringlist,
+)
+
+from ._testutils.errors import raise_non_string_data
+
+if sys.version_info >= (3, 11):
+    from typing import reveal_type
+else:
+    from typing_extensions import reveal_type
+
+# Unlike fromstring() which accepts any buffer since lxml 6.0,
+# feed parsers only ever accept str or bytes. These tests guard
+# against widening the feed() / fromstringlist() annotation.
+_CONTENT = b"<root><a>x</a><b/></root>"
+
+_feed_parsers = pytest.mark.parametrize(
+    "parser_cls", [XMLParser, HTMLParser, XMLPullParser, HTMLPullParser]
+)
+
+
+def _buffers(content: bytes) -> list[bytearray | memoryview]:
+    return [bytearray(content), memoryview(content), memoryview(b" " + content)[1:]]
+
+
+class TestFeed:
+    @_feed_parsers
+    def test_str_bytes_arg(self, parser_cls: type[XMLParser | HTMLParser]) -> None:
+        for data in (_CONTENT, _CONTENT.decode()):
+            parser = parser_cls()
+            parser.feed(data[:10])
+            parser.feed(data[10:])
+            root = parser.close()
+            reveal_type(root)
+            assert len(root.xpath("//a")) == 1
+
+    @_feed_parsers
+    def test_buffer_arg_bad(self, parser_cls: type[XMLParser | HTMLParser]) -> None:
+        for data in _buffers(_CONTENT):
+            parser = parser_cls()
+            with raise_non_string_data:
+                parser.feed(cast(Any, data))
+
+    def test_custom_target(self) -> None:
+        parser = XMLParser(target=TreeBuilder())
+        parser.feed(_CONTENT)
+        reveal_type(parser.close())
+
+        for data in _buffers(_CONTENT):
+            parser = XMLParser(target=TreeBuilder())
+            with raise_non_string_data:
+                parser.feed(cast(Any, data))
+
+
+class TestFromstringlist:
+    def test_str_bytes_arg(self) -> None:
+        for seq in ([_CONTENT[:10], _CONTENT[10:]], [_CONTENT.decode()]):
+            root = fromstringlist(seq)
+            reveal_type(root)
+            assert root.tag == "root"
+
+    def test_buffer_arg_bad(self) -> None:
+        for data in _buffers(_CONTENT):
+            with raise_non_string_data:
+                _ = fromstringlist(cast(Any, [data]))
+
+    def test_fromstring_contrast(self) -> None:
+        for data in _buffers(_CONTENT):
+            if LXML_VERSION >= (6, 0):
+                assert fromstring(data).tag == "root"
+            else:
+                with pytest.raises(ValueError, match=r"can only parse strings"):
+                    _ = fromstring(data)
@@ -4,10 +4,17 @@ import io
 import sys
 from collections.abc import Callable, Iterator
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 import pytest
-from lxml.etree import _Element as _Element, _ElementTree, iterparse, iterwalk
+from lxml.etree import (
+    HTMLPullParser,
+    XMLPullParser,
+    _Element as _Element,
+    _ElementTree,
+    iterparse,
+    iterwalk,
+)
 from lxml.html import HtmlElement
 
 if sys.version_info >= (3, 11):
@@ -38,20 +45,24 @@ class TestIterwalk:
             else:
                 reveal_type(item[1])
 
-    @pytest.mark.slow
-    def test_html_default_event(self, bightml_tree: _ElementTree[HtmlElement]) -> None:
-        walker = iterwalk(bightml_tree, tag=("div", "span"))
+    def test_html_default_event(
+        self, bightml_shared_tree: _ElementTree[HtmlElement]
+    ) -> None:
+        walker = iterwalk(bightml_shared_tree, tag=("div", "span"))
         reveal_type(walker)
         for event, elem in walker:
             reveal_type(event)
             reveal_type(elem)
 
     @pytest.mark.notypechecker("pyrefly")
-    @pytest.mark.slow
-    def test_html_more_event(self, bightml_tree: _ElementTree[HtmlElement]) -> None:
+    def test_html_more_event(
+        self, bightml_shared_tree: _ElementTree[HtmlElement]
+    ) -> None:
         # Since HtmlComment is pretended as HtmlElement subclass
         # in stub but not runtime, adding 'comment' event would fail
-        walker = iterwalk(bightml_tree, ("start", "end", "start-ns", "end-ns"), "div")
+        walker = iterwalk(
+            bightml_shared_tree, ("start", "end", "start-ns", "end-ns"), "div"
+        )
         reveal_type(walker)
         # Unlike iterparse(), iterwalk behaves the same with HTML
         for item in walker:
@@ -132,3 +143,84 @@ class TestIterparse:
         for event, elem in walker:
             reveal_type(event)
             reveal_type(elem)
+
+    # libxml2 memory usage is checked by the memory_check plugin
+    def test_html_clear_processed(self, bightml_bin_fp: BinaryIO) -> None:
+        walker = iterparse(bightml_bin_fp, html=True)
+        count = 0
+        for _, elem in walker:
+            count += 1
+            elem.clear(keep_tail=True)
+            parent = elem.getparent()
+            if parent is None:
+                continue
+            while elem.getprevious() is not None:
+                del parent[0]
+        assert count > 0
+        assert walker.root is not None
+        assert len(walker.root) <= 1
+
+
+class TestPullParser:
+    def test_xml_default_event(self, svg_filepath: Path) -> None:
+        parser = XMLPullParser()
+        reveal_type(parser)
+        parser.feed(svg_filepath.read_bytes())
+        for event, elem in parser.read_events():
+            reveal_type(event)
+            reveal_type(elem)
+
+    def test_xml_element_event(self, svg_filepath: Path) -> None:
+        parser = XMLPullParser(events=("start", "end", "comment"))
+        reveal_type(parser)
+        parser.feed(svg_filepath.read_bytes())
+        for event, elem in parser.read_events():
+            reveal_type(event)
+            reveal_type(elem)
+
+    def test_xml_ns_event(self, svg_filepath: Path) -> None:
+        parser = XMLPullParser(["start-ns", "end-ns"])
+        reveal_type(parser)
+        parser.feed(svg_filepath.read_bytes())
+        for item in parser.read_events():
+            if item[0] == "start-ns":
+                reveal_type(item[1])
+            else:
+                reveal_type(item[1])
+
+    @pytest.mark.notypechecker("pyrefly")
+    def test_xml_more_event(self, svg_filepath: Path) -> None:
+        parser = XMLPullParser(["start", "end", "start-ns", "end-ns", "comment"])
+        reveal_type(parser)
+        parser.feed(svg_filepath.read_bytes())
+        # Generated values are not unpacked here to test type narrowing
+        for item in parser.read_events():
+            if item[0] == "start-ns":
+                reveal_type(item[1])
+            elif item[0] == "end-ns":
+                reveal_type(item[1])
+            else:
+                reveal_type(item[1])
+
+    def test_match_statement(self, svg_filepath: Path) -> None:
+        parser = XMLPullParser(["start", "end", "start-ns", "end-ns", "comment"])
+        parser.feed(svg_filepath.read_bytes())
+        for item in parser.read_events():
+            match item:
+                case (str() as event, _Element() as elem):
+                    reveal_type(event)
+                    reveal_type(elem)
+                case ("start-ns", (str() as prefix, str() as uri)):
+                    reveal_type(prefix)
+                    reveal_type(uri)
+                case _:
+                    reveal_type(item)
+
+    def test_html_mode(self, svg_filepath: Path) -> None:
+        # Namespace events are silently ignored in HTML mode
+        parser = HTMLPullParser(("start", "end", "start-ns", "end-ns"))
+        reveal_type(parser)
+        parser.feed(svg_filepath.read_bytes())
+        for event, elem in parser.read_events():
+            reveal_type(event)
+            reveal_type(elem)
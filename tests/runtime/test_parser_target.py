@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+from lxml.etree import (
+    HTMLParser,
+    TreeBuilder,
+    XMLParser,
+    _Element as _Element,
+    fromstring,
+    parse,
+)
+
+if sys.version_info >= (3, 11):
+    from typing import reveal_type
+else:
+    from typing_extensions import reveal_type
+
+# Content exercising every kind of parser event; targets below
+# deliberately leave most callbacks undefined, which lxml skips
+_CONTENT = b"""<?xml version="1.0"?>
+<!DOCTYPE root>
+<root xmlns:a="http://example.org/a">
+  <!-- comment --><?target data?>
+  <a:item>text</a:item><item/>
+</root>"""
+
+_HTML_CONTENT = "<html><body><!-- comment --><p>para</p><p>graph</p></body></html>"
+
+
+# None of the classes below inherit from target protocols,
+# they match StartEndTarget etc structurally
+class ElementCounter:
+    def __init__(self) -> None:
+        self.count = 0
+
+    def start(self, tag: str, attrib: dict[str, str], /) -> None:
+        self.count += 1
+
+    def end(self, tag: str, /) -> None:
+        pass
+
+    def close(self) -> int:
+        return self.count
+
+
+class TextCollector:
+    def __init__(self) -> None:
+        self.chunks: list[str] = []
+
+    def data(self, data: str, /) -> None:
+        self.chunks.append(data)
+
+    def close(self) -> str:
+        return "".join(self.chunks).strip()
+
+
+class NamespaceCollector:
+    def __init__(self) -> None:
+        self.ns: dict[str, str] = {}
+
+    def start_ns(self, prefix: str, uri: str, /) -> None:
+        self.ns[prefix] = uri
+
+    def end_ns(self, prefix: str, /) -> None:
+        pass
+
+    def close(self) -> dict[str, str]:
+        return self.ns
+
+
+class TagTextCounter:
+    def __init__(self) -> None:
+        self.tags = 0
+        self.chunks = 0
+
+    def start(self, tag: str, attrib: dict[str, str], /) -> None:
+        self.tags += 1
+
+    def end(self, tag: str, /) -> None:
+        pass
+
+    def data(self, data: str, /) -> None:
+        self.chunks += 1
+
+    def close(self) -> tuple[int, int]:
+        return self.tags, self.chunks
+
+
+class TestStartEndTarget:
+    def test_xml_parser(self) -> None:
+        parser = XMLParser(target=ElementCounter())
+        result = reveal_type(fromstring(_CONTENT, parser))
+        assert result == 3
+
+    def test_html_parser(self) -> None:
+        parser = HTMLParser(target=ElementCounter())
+        result = reveal_type(fromstring(_HTML_CONTENT, parser))
+        assert result == 4
+
+    def test_parse(self, svg_filepath: Path) -> None:
+        parser = XMLParser(target=ElementCounter())
+        result = reveal_type(parse(svg_filepath, parser))
+        assert result > 0
+
+
+class TestDataTarget:
+    def test_xml_parser(self) -> None:
+        parser = XMLParser(target=TextCollector())
+        result = reveal_type(fromstring(_CONTENT, parser))
+        assert result == "text"
+
+    def test_html_parser(self) -> None:
+        parser = HTMLParser(target=TextCollector())
+        result = reveal_type(fromstring(_HTML_CONTENT, parser))
+        assert result == "paragraph"
+
+    def test_parse(self, xml2_filepath: Path) -> None:
+        parser = XMLParser(target=TextCollector())
+        result = reveal_type(parse(xml2_filepath, parser))
+        assert "Ola Nordmann" in result
+
+
+class TestNamespaceTarget:
+    def test_xml_parser(self) -> None:
+        parser = XMLParser(target=NamespaceCollector())
+        result = reveal_type(fromstring(_CONTENT, parser))
+        assert result == {"a": "http://example.org/a"}
+
+    # HTML parser never emits namespace events
+    def test_html_parser(self) -> None:
+        parser = HTMLParser(target=NamespaceCollector())
+        content = '<html xmlns:a="http://example.org/a"><body/></html>'
+        result = reveal_type(fromstring(content, parser))
+        assert result == {}
+
+    def test_parse(self, svg_filepath: Path) -> None:
+        parser = XMLParser(target=NamespaceCollector())
+        result = reveal_type(parse(svg_filepath, parser))
+        assert "xlink" in result
+
+
+class TestCombinedTarget:
+    def test_xml_parser(self) -> None:
+        parser = XMLParser(target=TagTextCounter())
+        tags, chunks = reveal_type(fromstring(_CONTENT, parser))
+        assert tags == 3
+        assert chunks > 0
+
+    def test_tree_builder(self) -> None:
+        parser = XMLParser(target=TreeBuilder())
+        result = reveal_type(fromstring(_CONTENT, parser))
+        # Comment and PI are inserted alongside elements
+        assert len(result) == 4
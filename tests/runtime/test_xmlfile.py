@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+from collections.abc import Awaitable, Callable
+
+from lxml.etree import Element, htmlfile, xmlfile
+
+if sys.version_info >= (3, 11):
+    from typing import reveal_type
+else:
+    from typing_extensions import reveal_type
+
+
+class StreamSink:
+    """Asynchronous sink writing into asyncio stream, since
+    StreamWriter.write() itself is not awaitable"""
+
+    def __init__(self, writer: asyncio.StreamWriter) -> None:
+        self._writer = writer
+
+    async def write(self, data: bytes) -> None:
+        self._writer.write(data)
+        await self._writer.drain()
+
+    async def close(self) -> None:
+        self._writer.close()
+        await self._writer.wait_closed()
+
+
+async def _roundtrip(produce: Callable[[StreamSink], Awaitable[None]]) -> bytes:
+    """Run producer against sink connected to local stream server,
+    and return everything the server has received"""
+    received: asyncio.Future[bytes] = asyncio.get_running_loop().create_future()
+
+    async def handle(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        received.set_result(await reader.read())
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    async with server:
+        port = server.sockets[0].getsockname()[1]
+        _, writer = await asyncio.open_connection("127.0.0.1", port)
+        await produce(StreamSink(writer))
+        return await received
+
+
+class TestAsyncXmlfile:
+    def test_stream_sink(self) -> None:
+        async def produce(sink: StreamSink) -> None:
+            async with xmlfile(sink, encoding="utf-8", close=True) as xf:
+                await xf.write_declaration()
+                async with xf.element("root", nsmap={None: "urn:x"}):
+                    await xf.write(Element("child"), "text")
+                    await xf.flush()
+
+        data = asyncio.run(_roundtrip(produce))
+        reveal_type(data)
+        assert data.startswith(b"<?xml version='1.0' encoding='utf-8'?>")
+        assert data.endswith(b'<root xmlns="urn:x"><child/>text</root>')
+
+    def test_unbuffered(self) -> None:
+        async def produce(sink: StreamSink) -> None:
+            async with htmlfile(sink, buffered=False, close=True) as hf:
+                async with hf.element("p"):
+                    await hf.write("<escaped>")
+
+        assert asyncio.run(_roundtrip(produce)) == b"<p>&lt;escaped&gt;</p>"
@@ -9,6 +9,7 @@ from typing import Any, cast
 
 import pytest
 from hypothesis import HealthCheck, given, settings
+from lxml import html
 from lxml.etree import (
     ETXPath,
     XPath,
@@ -23,6 +24,12 @@ from lxml.etree import (
     _ListErrorLog as _ListErrorLog,
     iselement,
 )
+from lxml.html import (
+    FormElement as FormElement,
+    HtmlElement as HtmlElement,
+    InputElement as InputElement,
+    LabelElement as LabelElement,
+)
 
 from ._testutils import signature_tester, strategy as _st
 from ._testutils.common import (
@@ -109,6 +116,83 @@ class TestElementXPathPath:
             disposable_element.xpath(iterable_of("//item"))
 
 
+@pytest.mark.onlytypechecker("mypy")
+class TestXPathLiteralResult:
+    """Result types inferred by mypy plugin from literal XPath
+    expressions, which are Any for other type checkers"""
+
+    def test_element_xpath(self, xml2_root: _Element) -> None:
+        reveal_type(xml2_root.xpath("//item"))
+        reveal_type(xml2_root.xpath("//item/@id"))
+        reveal_type(xml2_root.xpath("//item/title/text()", smart_strings=False))
+        reveal_type(xml2_root.xpath("count(//item)"))
+        reveal_type(xml2_root.xpath("boolean(//item)"))
+        reveal_type(xml2_root.xpath("string(//orderperson)"))
+        reveal_type(xml2_root.xpath("//shipto | //item[1]"))
+
+    def test_tree_xpath(self, xml2_tree: _ElementTree) -> None:
+        reveal_type(xml2_tree.xpath("//item/title"))
+        reveal_type(xml2_tree.xpath("//item/@id | //shipto/name/text()"))
+
+    def test_html_form_elements(self) -> None:
+        root = html.fromstring(
+            '<form><label for="a">A</label><input id="a"/><p>x</p></form>'
+        )
+        reveal_type(root.xpath("//label"))
+        reveal_type(root.xpath("//input | //form"))
+        reveal_type(root.xpath("//p"))
+
+    def test_evaluator_call(self, xml2_root: _Element, xml2_tree: _ElementTree) -> None:
+        reveal_type(XPath("//item")(xml2_tree))
+        reveal_type(XPath("//item/@id", smart_strings=False)(xml2_root))
+        reveal_type(XPathEvaluator(xml2_root)("//item"))
+        reveal_type(XPathEvaluator(xml2_tree)("sum(//item/quantity)"))
+
+    # list is invariant, so annotation of wider item type must
+    # still be accepted for narrowed results
+    def test_annotated_list(self, xml2_root: _Element) -> None:
+        root = html.fromstring('<form><input id="a"/><a href="b">c</a></form>')
+        inputs: list[HtmlElement] = root.xpath("//input")
+        anchors: list[_Element] = root.xpath("//a")
+        ids: list[str] = xml2_root.xpath("//item/@id")
+        hrefs: list[str] | None = XPath("//a/@href")(root)
+        assert len(inputs) == len(anchors) == 1
+        assert ids and hrefs == ["b"]
+
+    # smart_strings of stored evaluators is unknown, which leaves
+    # plain str results
+    def test_evaluator_smart_strings(self, xml2_root: _Element) -> None:
+        evaluator = XPathEvaluator(xml2_root, smart_strings=False)
+        reveal_type(evaluator("//item/@id"))
+        reveal_type(evaluator("string(//orderperson)"))
+        reveal_type(XPathEvaluator(xml2_root, smart_strings=False)("//item/@id"))
+        reveal_type(XPathElementEvaluator(xml2_root)("//item/@id"))
+        reveal_type(XPathEvaluator(xml2_root)("//item/@id"))
+
+
+# Unrelated classes with xpath() method, which mypy plugin must
+# leave alone. Shape of first one follows parsel.Selector.
+class Selector:
+    def xpath(
+        self, query: str, namespaces: Any = None, **kwargs: Any
+    ) -> list[Selector]:
+        return [self]
+
+
+class NoArgXPath:
+    def xpath(self) -> int:
+        return 0
+
+
+class TestNonLxmlXPathMethod:
+    def test_selector_like(self) -> None:
+        reveal_type(Selector().xpath("//a"))
+        reveal_type(Selector().xpath("//a/@href", smart_strings=False))
+
+    def test_no_arg(self) -> None:
+        reveal_type(NoArgXPath().xpath())
+
+
 class TestElementXPathNamespaces:
     def test_namespaces_none(self, xml2_root: _Element) -> None:
         result = xml2_root.xpath("//item", namespaces=None)
@@ -215,8 +299,9 @@ class TestElementXPathExtensions:
 
 class TestElementXPathSmartStrings:
     def test_smart_strings_true(self, xml2_root: _Element) -> None:
-        result = xml2_root.xpath("//orderperson/text()", smart_strings=True)
-        result = cast(list[_ElementUnicodeResult], result)
+        result: list[_ElementUnicodeResult[_Element]] = xml2_root.xpath(
+            "//orderperson/text()", smart_strings=True
+        )
         assert len(result) == 1
         val = result[0]
         assert isinstance(val, _ElementUnicodeResult)
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from mypy import build
+from mypy.modulefinder import BuildSource
+from mypy.nodes import TypeInfo
+from mypy.options import Options
+
+from mypy_plugin_lxml.main import MypyLxmlPlugin
+
+_SOURCE = """\
+from lxml import etree, html
+parser = etree.XMLParser()
+parser.set_element_class_lookup(html.HtmlElementClassLookup())
+reveal_type(parser)
+"""
+
+
+def _build(plugin: MypyLxmlPlugin) -> build.BuildResult:
+    options = Options()
+    options.incremental = False
+    return build.build(
+        [BuildSource(None, "main", _SOURCE)], options, extra_plugins=[plugin]
+    )
+
+
+# mypy daemon and API users may reuse plugin instance for later builds,
+# which bring along new TypeInfo objects
+def test_cache_follows_build() -> None:
+    plugin = MypyLxmlPlugin(Options())
+    for _ in range(2):
+        result = _build(plugin)
+        assert any(
+            "XMLParser[lxml.html._element.HtmlElement]" in m for m in result.errors
+        )
+        assert plugin._typeinfos
+        for fullname, info in plugin._typeinfos.items():
+            module, _, name = fullname.rpartition(".")
+            node = result.manager.modules[module].names[name].node
+            assert isinstance(node, TypeInfo)
+            assert info is node